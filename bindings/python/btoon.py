@@ -6,7 +6,9 @@ A high-performance binary serialization format with a Pythonic API.
 
 __version__ = "0.0.1"
 __all__ = [
-    'dumps', 'loads',
+    'dumps', 'loads', 'size',
+    'dumps_many', 'loads_many',
+    'dumps_dataframe', 'loads_dataframe',
     'dump', 'load',
     'Encoder', 'Decoder',
     'Schema', 'SchemaBuilder',
@@ -15,9 +17,18 @@ __all__ = [
     'compress_types'
 ]
 
+import functools
 import io
+import itertools
+import json
+import mmap
+import os
 import pathlib
-from typing import Any, BinaryIO, Optional, Union, Dict, List
+import struct
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Optional, Union, Dict, Iterable, List
 from contextlib import contextmanager
 from enum import Enum
 
@@ -34,8 +45,6 @@ except ImportError:
 
 # Re-export native functions with Pythonic names
 if HAS_NATIVE:
-    dumps = _native.dumps
-    loads = _native.loads
     Encoder = _native.Encoder
     Decoder = _native.Decoder
     Schema = _native.Schema
@@ -44,6 +53,307 @@ if HAS_NATIVE:
     BtoonException = _native.BtoonException
     Compression = _native.Compression
 
+# Big-endian u32 length prefix used by the stream framing
+_HDR = struct.Struct('>I')
+
+# Per-thread Encoder/Decoder instances reused by dumps/loads, keyed by options
+_local = threading.local()
+
+
+def _cached_encoder(compress: bool, compression: str, workers: int = 0,
+                    frame_size: int = 0) -> 'Encoder':
+    cache = getattr(_local, 'encoders', None)
+    if cache is None:
+        cache = _local.encoders = {}
+    key = (compress, compression, workers, frame_size)
+    enc = cache.get(key)
+    if enc is None:
+        enc = cache[key] = Encoder(compress=compress, algorithm=compression,
+                                   workers=workers, frame_size=frame_size)
+    return enc
+
+
+def _cached_decoder(strict: bool, use_decimal: bool) -> 'Decoder':
+    cache = getattr(_local, 'decoders', None)
+    if cache is None:
+        cache = _local.decoders = {}
+    key = (strict, use_decimal)
+    dec = cache.get(key)
+    if dec is None:
+        dec = cache[key] = Decoder(strict=strict, use_decimal=use_decimal)
+    return dec
+
+
+def dumps(obj: Any, /, compress: bool = False, compression: str = "auto",
+          workers: int = 0, frame_size: int = 0,
+          schema: Optional['Schema'] = None) -> bytes:
+    """
+    Serialize object to BTOON bytes.
+    
+    Reuses a per-thread Encoder for each distinct option set instead of
+    constructing a new one on every call.
+    
+    Args:
+        obj: Python object to serialize
+        compress: Enable compression
+        compression: Algorithm ('zlib', 'lz4', 'zstd', 'auto')
+        workers: ZSTD compression threads; 0 compresses on the calling
+            thread, -1 uses one per CPU for payloads over 1 MiB
+        frame_size: With ZSTD, split the output into independent frames of
+            this many input bytes (pzstd-compatible) so decoding can
+            decompress them in parallel; 0 writes a single frame
+        schema: Encode a record with an encoder specialized for this
+            schema; fields are written as their declared types
+    
+    Returns:
+        BTOON encoded bytes
+    
+    Example:
+        >>> btoon.dumps(big_obj, compress=True, compression='zstd',
+        ...             frame_size=4 << 20)
+    """
+    enc = _cached_encoder(compress, compression, workers, frame_size)
+    if schema is not None:
+        return enc.encode_compiled(obj, _compiled_encoder(schema))
+    return enc.encode(obj)
+
+
+def size(obj: Any, compress: bool = False, compression: str = "auto") -> int:
+    """
+    Size in bytes of ``dumps(obj, compress, compression)``.
+    
+    The payload is encoded natively but never copied into a Python bytes
+    object, for callers that only report the size.
+    
+    Args:
+        obj: Python object to measure
+        compress: Enable compression
+        compression: Algorithm ('zlib', 'lz4', 'zstd', 'auto')
+    
+    Returns:
+        Encoded size in bytes
+    """
+    return _cached_encoder(compress, compression).encoded_size(obj)
+
+
+def _compiled_encoder(schema: 'Schema'):
+    # Compiled once per Schema instance and kept on it
+    compiled = getattr(schema, '_compiled_encoder', None)
+    if compiled is None:
+        compiled = schema._compiled_encoder = schema.compile_encoder()
+    return compiled
+
+
+def loads(data: bytes, /, strict: bool = False, use_decimal: bool = False) -> Any:
+    """
+    Deserialize BTOON bytes to Python object.
+    
+    Args:
+        data: BTOON bytes to decode
+        strict: Enable strict validation
+        use_decimal: Use Decimal for floats
+    
+    Returns:
+        Decoded Python object
+    """
+    return _cached_decoder(strict, use_decimal).decode(data)
+
+
+def dumps_many(objs, compress: bool = False, compression: str = "auto") -> List[bytes]:
+    """
+    Serialize a batch of objects to BTOON in one native call.
+    
+    Args:
+        objs: Iterable of Python objects
+        compress: Enable compression
+        compression: Algorithm ('zlib', 'lz4', 'zstd', 'auto')
+    
+    Returns:
+        List of BTOON payloads, one per object
+    """
+    return _cached_encoder(compress, compression).encode_many(objs)
+
+
+def loads_many(payloads, strict: bool = False, use_decimal: bool = False) -> List[Any]:
+    """
+    Deserialize a batch of BTOON payloads in one native call.
+    
+    Args:
+        payloads: Iterable of BTOON bytes objects
+        strict: Enable strict validation
+        use_decimal: Use Decimal for floats
+    
+    Returns:
+        List of decoded objects, one per payload
+    """
+    return _cached_decoder(strict, use_decimal).decode_many(payloads)
+
+
+def dumps_dataframe(df, compress: bool = False, compression: str = "auto") -> bytes:
+    """
+    Serialize a pandas DataFrame column by column.
+    
+    Numeric and datetime columns are written as one raw buffer each, so
+    no per-cell Python objects are created; low-cardinality string
+    columns as their unique values plus one small code per row; other
+    columns as lists. Frames whose columns all share one numeric dtype
+    are written as a single column-major matrix. The payload uses the
+    ``"__dataframe__"`` layout that btoon_enhanced also reads and writes.
+    
+    Args:
+        df: pandas DataFrame to serialize
+        compress: Enable compression
+        compression: Algorithm ('zlib', 'lz4', 'zstd', 'auto')
+    
+    Returns:
+        BTOON encoded bytes
+    """
+    return dumps({"__dataframe__": _dataframe_payload(df)}, compress, compression)
+
+
+def loads_dataframe(data: bytes, strict: bool = False):
+    """
+    Deserialize a DataFrame written by ``dumps_dataframe``.
+    
+    A payload holding a list of records is also accepted.
+    
+    Args:
+        data: BTOON bytes to decode
+        strict: Enable strict validation
+    
+    Returns:
+        pandas DataFrame
+    """
+    import pandas as pd
+    
+    obj = loads(data, strict)
+    if isinstance(obj, list):
+        return pd.DataFrame(obj)
+    if not isinstance(obj, dict) or "__dataframe__" not in obj:
+        raise ValueError("Data cannot be converted to DataFrame")
+    return _dataframe_from_payload(obj["__dataframe__"])
+
+
+def _dataframe_payload(df) -> Dict[str, Any]:
+    """The ``"__dataframe__"`` payload for a DataFrame (structure of arrays)."""
+    import numpy as np
+    import pandas as pd
+    
+    payload = {"columns": df.columns.tolist()}
+    dtypes = df.dtypes
+    if (df.shape[1] > 1 and isinstance(dtypes.iloc[0], np.dtype)
+            and dtypes.iloc[0].kind in "biufc" and (dtypes == dtypes.iloc[0]).all()):
+        # One shared numeric dtype: write the whole block as a single
+        # column-major buffer rather than one buffer per column
+        block = df.to_numpy().T
+        if not block.flags.c_contiguous:
+            block = np.ascontiguousarray(block)
+        payload["dtype"] = str(block.dtype)
+        payload["shape"] = list(df.shape)
+        payload["matrix"] = _array_buffer(block)
+    else:
+        payload["dtypes"] = []
+        payload["column_data"] = []
+        for i in range(df.shape[1]):
+            dtype, values = _encode_column(df.iloc[:, i].to_numpy())
+            payload["dtypes"].append(dtype)
+            payload["column_data"].append(values)
+    
+    # A default RangeIndex is omitted
+    index = df.index
+    if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+        payload["index_dtype"], payload["index"] = None, None
+    else:
+        payload["index_dtype"], payload["index"] = _encode_column(index.to_numpy())
+    return payload
+
+
+def _dataframe_from_payload(payload: Dict[str, Any]):
+    """Rebuild a DataFrame from a ``"__dataframe__"`` payload."""
+    import numpy as np
+    import pandas as pd
+    
+    if "matrix" in payload:
+        rows, cols = payload["shape"]
+        block = np.frombuffer(payload["matrix"], dtype=payload["dtype"]).reshape(cols, rows)
+        df = pd.DataFrame(block.T, copy=True)
+    elif "column_data" in payload:
+        df = pd.DataFrame({
+            i: _decode_column(values, dtype)
+            for i, (values, dtype) in enumerate(zip(payload["column_data"], payload["dtypes"]))
+        })
+    else:
+        # Row-oriented layout written by earlier versions
+        df = pd.DataFrame(payload["data"], columns=payload["columns"])
+        if payload["index"]:
+            df.index = payload["index"]
+        return df
+    
+    df.columns = payload["columns"]
+    if payload["index"] is not None:
+        df.index = _decode_column(payload["index"], payload["index_dtype"])
+    return df
+
+
+def _array_buffer(arr) -> Union[memoryview, bytes]:
+    """Raw bytes of a C-contiguous array, without copying where possible."""
+    try:
+        return memoryview(arr).cast("B")
+    except (TypeError, ValueError):
+        # dtypes without a buffer format (datetime64, ...)
+        return arr.tobytes()
+
+
+def _encode_column(values) -> tuple:
+    """Return (dtype, payload) for one column's ndarray."""
+    import numpy as np
+    
+    if values.dtype.kind in "biufcmM":
+        return str(values.dtype), _array_buffer(np.ascontiguousarray(values))
+    if values.dtype.kind == "O" and len(values) >= 8:
+        encoded = _dictionary_encode(values)
+        if encoded is not None:
+            return str(values.dtype), encoded
+    return str(values.dtype), values.tolist()
+
+
+def _dictionary_encode(values) -> Optional[Dict[str, Any]]:
+    """
+    Replace a low-cardinality column (unique values fewer than a quarter
+    of the rows) with its unique values plus one small integer code per row.
+    
+    Only all-string columns qualify: factorize merges values that compare
+    equal, such as 1, 1.0 and True, or 0.0 and -0.0, and missing values.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    if pd.api.types.infer_dtype(values, skipna=False) != "string":
+        return None
+    codes, uniques = pd.factorize(values, sort=False)
+    if len(uniques) >= min(65536, len(values) // 4):
+        return None
+    code_dtype = np.uint8 if len(uniques) <= 256 else np.uint16
+    return {
+        "__dict_encoded__": True,
+        "uniques": list(uniques),
+        "codes": _array_buffer(codes.astype(code_dtype))
+    }
+
+
+def _decode_column(values: Any, dtype: Optional[str]) -> Any:
+    import numpy as np
+    
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        return np.frombuffer(values, dtype=dtype)
+    if isinstance(values, dict) and values.get("__dict_encoded__"):
+        uniques = np.empty(len(values["uniques"]), dtype=object)
+        uniques[:] = values["uniques"]
+        code_dtype = np.uint8 if len(uniques) <= 256 else np.uint16
+        return uniques[np.frombuffer(values["codes"], dtype=code_dtype)]
+    return values
+
+
 # Compression types for convenience
 class compress_types(Enum):
     """Compression algorithm types"""
@@ -54,11 +364,16 @@ class compress_types(Enum):
     AUTO = "auto"
 
 
+# Enum member -> native algorithm name; plain strings pass through .get()
+_COMP_MAP = {c: c.value for c in compress_types}
+
+
 def dump(obj: Any, 
          fp: BinaryIO,
          compress: bool = False,
          compression: Union[str, compress_types] = compress_types.AUTO,
-         **kwargs) -> None:
+         workers: int = 0,
+         frame_size: int = 0) -> None:
     """
     Serialize object to BTOON and write to file.
     
@@ -67,23 +382,21 @@ def dump(obj: Any,
         fp: Binary file-like object to write to
         compress: Enable compression
         compression: Compression algorithm
-        **kwargs: Additional encoder options
+        workers: ZSTD compression threads (see ``dumps``)
+        frame_size: ZSTD independent frame size (see ``dumps``)
     
     Example:
         >>> with open('data.btoon', 'wb') as f:
         ...     btoon.dump({'key': 'value'}, f)
     """
-    if isinstance(compression, compress_types):
-        compression = compression.value
-    
-    data = dumps(obj, compress=compress, compression=compression, **kwargs)
+    compression = _COMP_MAP.get(compression, compression)
+    data = dumps(obj, compress, compression, workers, frame_size)
     fp.write(data)
 
 
 def load(fp: BinaryIO,
          strict: bool = False,
-         use_decimal: bool = False,
-         **kwargs) -> Any:
+         use_decimal: bool = False) -> Any:
     """
     Read BTOON from file and deserialize.
     
@@ -91,7 +404,6 @@ def load(fp: BinaryIO,
         fp: Binary file-like object to read from
         strict: Enable strict validation
         use_decimal: Use Decimal for floats
-        **kwargs: Additional decoder options
     
     Returns:
         Deserialized Python object
@@ -100,14 +412,44 @@ def load(fp: BinaryIO,
         >>> with open('data.btoon', 'rb') as f:
         ...     data = btoon.load(f)
     """
+    fileno = None
+    if _is_raw_file(fp):
+        try:
+            fileno = fp.fileno()
+            offset = fp.tell()
+        except OSError:
+            fileno = None
+    
+    if fileno is not None:
+        if os.fstat(fileno).st_size > offset:
+            # Decode straight from the page cache instead of copying the
+            # whole file into a bytes object first
+            with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view, view[offset:] as data:
+                    obj = loads(data, strict, use_decimal)
+            fp.seek(0, io.SEEK_END)
+            return obj
+    
     data = fp.read()
-    return loads(data, strict=strict, use_decimal=use_decimal, **kwargs)
+    return loads(data, strict, use_decimal)
+
+
+def _is_raw_file(fp: Any) -> bool:
+    """
+    True if fp reads its file descriptor's bytes unchanged. Wrappers such
+    as gzip.GzipFile also have fileno(), but it is the compressed file's.
+    """
+    if isinstance(fp, (io.BufferedReader, io.BufferedRandom)):
+        fp = fp.raw
+    return isinstance(fp, io.FileIO)
 
 
 def dump_file(obj: Any,
               path: Union[str, pathlib.Path],
               compress: bool = False,
-              **kwargs) -> None:
+              compression: Union[str, compress_types] = compress_types.AUTO,
+              workers: int = 0,
+              frame_size: int = 0) -> None:
     """
     Serialize object to BTOON file.
     
@@ -115,28 +457,32 @@ def dump_file(obj: Any,
         obj: Object to serialize
         path: File path
         compress: Enable compression
-        **kwargs: Additional options
+        compression: Compression algorithm
+        workers: ZSTD compression threads (see ``dumps``)
+        frame_size: ZSTD independent frame size (see ``dumps``)
     """
-    path = pathlib.Path(path)
+    path = os.fspath(path)
     with open(path, 'wb') as f:
-        dump(obj, f, compress=compress, **kwargs)
+        dump(obj, f, compress, compression, workers, frame_size)
 
 
 def load_file(path: Union[str, pathlib.Path],
-              **kwargs) -> Any:
+              strict: bool = False,
+              use_decimal: bool = False) -> Any:
     """
     Load object from BTOON file.
     
     Args:
         path: File path
-        **kwargs: Decoder options
+        strict: Enable strict validation
+        use_decimal: Use Decimal for floats
     
     Returns:
         Deserialized object
     """
-    path = pathlib.Path(path)
+    path = os.fspath(path)
     with open(path, 'rb') as f:
-        return load(f, **kwargs)
+        return load(f, strict, use_decimal)
 
 
 @contextmanager
@@ -178,14 +524,18 @@ class SchemaRegistry:
         >>> registry.validate(data, 'user')
     """
     
+    __slots__ = ('_schemas', '_validators')
+    
     def __init__(self):
         self._schemas: Dict[str, Schema] = {}
+        self._validators: Dict[str, Any] = {}
     
     def register(self, schema: Schema, name: Optional[str] = None) -> None:
         """Register a schema."""
         if name is None:
             name = schema.get_name()
         self._schemas[name] = schema
+        self._validators[name] = schema.validate
     
     def get(self, name: str) -> Optional[Schema]:
         """Get schema by name."""
@@ -193,10 +543,25 @@ class SchemaRegistry:
     
     def validate(self, data: Any, schema_name: str) -> bool:
         """Validate data against named schema."""
-        schema = self.get(schema_name)
+        validator = self._validators.get(schema_name)
+        if validator is None:
+            raise ValueError(f"Schema '{schema_name}' not found")
+        return validator(data)
+    
+    def validate_many(self, records: Any, schema_name: str) -> List[bool]:
+        """
+        Validate a batch of records against a named schema.
+        
+        The schema is resolved once and the records are checked in a
+        single native call.
+        
+        Returns:
+            One bool per record
+        """
+        schema = self._schemas.get(schema_name)
         if schema is None:
             raise ValueError(f"Schema '{schema_name}' not found")
-        return schema.validate(data)
+        return _native.validate_batch(schema, records)
     
     def __contains__(self, name: str) -> bool:
         return name in self._schemas
@@ -228,27 +593,70 @@ def create_schema(name: str,
         ...     {'name': 'email', 'type': 'string', 'required': False}
         ... ])
     """
+    # Values are keyed with their type: 1, 1.0 and True are equal and hash
+    # alike but make different schemas
+    fields_key = tuple(tuple(sorted((key, _typed_key(value)) for key, value in field.items()))
+                       for field in fields)
+    try:
+        hash(fields_key)
+    except TypeError:
+        # Unhashable default values; build without caching
+        return _build_schema(name, version, description, fields)
+    return _build_schema_cached(name, version, description, fields_key)
+
+
+def _typed_key(value: Any) -> tuple:
+    if type(value) is tuple:
+        return (tuple, tuple(_typed_key(item) for item in value))
+    return (type(value), value)
+
+
+def _from_typed_key(key: tuple) -> Any:
+    kind, value = key
+    if kind is tuple:
+        return tuple(_from_typed_key(item) for item in value)
+    return value
+
+
+def _build_schema(name: str, version: str, description: str,
+                  fields: List[Dict[str, Any]]) -> Schema:
     builder = SchemaBuilder(name)
     builder.version(version)
     
     if description:
         builder.description(description)
     
-    for field in fields:
-        builder.field(
-            name=field['name'],
-            type=field['type'],
-            required=field.get('required', True),
-            default_value=field.get('default')
-        )
+    builder.add_fields_bulk(fields)
     
     return builder.build()
 
 
+@functools.lru_cache(maxsize=256)
+def _build_schema_cached(name: str, version: str, description: str,
+                         fields_key: tuple) -> Schema:
+    # Identical definitions share one canonical Schema instance
+    return _build_schema(name, version, description,
+                         [{key: _from_typed_key(value) for key, value in field}
+                          for field in fields_key])
+
+
 class StreamEncoder:
     """
     Streaming encoder for large datasets.
     
+    By default every object is encoded and written to ``fp`` before
+    ``write`` returns, so callers may reuse or mutate it afterwards.
+    With ``batch_size`` above 1, objects are instead queued and encoded
+    in batches with a single native call; queued objects must not be
+    mutated until they are encoded, and ``flush`` (or leaving the
+    ``with`` block) writes out any remaining ones.
+    
+    With ``block_size`` set, frames are collected uncompressed in one
+    reused buffer and written as a single block frame (compressed as a
+    whole when compression is enabled) each time ``block_size`` bytes
+    accumulate, instead of compressing every record on its own.
+    StreamDecoder expands blocks transparently.
+    
     Example:
         >>> with open('large.btoon', 'wb') as f:
         ...     with StreamEncoder(f) as encoder:
@@ -256,23 +664,86 @@ class StreamEncoder:
         ...             encoder.write(item)
     """
     
-    def __init__(self, fp: BinaryIO, **kwargs):
+    __slots__ = ('fp', 'encoder', 'batch_size', 'block_size', '_pending', '_buf',
+                 '_frames', '_block')
+    
+    def __init__(self, fp: BinaryIO, batch_size: int = 1, block_size: int = 0, **kwargs):
+        if batch_size > 1 and isinstance(fp, io.RawIOBase):
+            # Batched writes already wait for flush(); coalesce them through
+            # a large buffer rather than one syscall (and possible short
+            # write) per batch
+            fp = io.BufferedWriter(fp, buffer_size=1 << 20)
+        if 'algorithm' in kwargs:
+            kwargs['algorithm'] = _COMP_MAP.get(kwargs['algorithm'], kwargs['algorithm'])
         self.fp = fp
         self.encoder = Encoder(**kwargs)
+        self.batch_size = batch_size
+        self._pending: List[Any] = []
+        # Reused for every batch: frames are encoded straight into it
+        self._buf = bytearray()
+        self.block_size = block_size
+        # Block mode: records are framed uncompressed into _block
+        self._frames = Encoder() if block_size else None
+        self._block = bytearray()
     
     def write(self, obj: Any) -> None:
         """Write object to stream."""
-        data = self.encoder.encode(obj)
-        # Write length prefix for streaming
-        length = len(data)
-        self.fp.write(length.to_bytes(4, 'big'))
-        self.fp.write(data)
+        self._pending.append(obj)
+        if len(self._pending) >= self.batch_size:
+            self._write_pending()
+    
+    def write_many(self, objs: Iterable[Any], batch: Optional[int] = None) -> None:
+        """
+        Write every object from an iterable to the stream.
+        
+        Objects are taken ``batch`` (default ``batch_size``) at a time and
+        each batch is encoded with one native call; a partial last batch
+        is written too unless ``batch_size`` queues it like ``write`` does.
+        """
+        batch = batch or self.batch_size
+        items = iter(objs)
+        pending = self._pending
+        while True:
+            pending.extend(itertools.islice(items, max(batch - len(pending), 0)))
+            if len(pending) < batch:
+                break
+            self._write_pending()
+        if len(pending) >= self.batch_size:
+            self._write_pending()
+    
+    def flush(self) -> None:
+        """Encode any queued objects and flush the underlying file."""
+        self._write_pending()
+        if self._block:
+            self._write_block()
+        self.fp.flush()
+    
+    def _write_pending(self) -> None:
+        if not self._pending:
+            return
+        if self._frames is not None:
+            self._frames.encode_framed_into(self._pending, self._block, len(self._block))
+            self._pending.clear()
+            if len(self._block) >= self.block_size:
+                self._write_block()
+            return
+        # Length-prefix framing for the whole batch is done natively
+        self.encoder.encode_framed_into(self._pending, self._buf)
+        self.fp.write(self._buf)
+        self._pending.clear()
+    
+    def _write_block(self) -> None:
+        with memoryview(self._block) as frames:
+            self.encoder.encode_framed_into([_native.Extension(_BLOCK_EXT_TYPE, frames)],
+                                            self._buf)
+        self.fp.write(self._buf)
+        del self._block[:]
     
     def __enter__(self):
         return self
     
     def __exit__(self, *args):
-        self.fp.flush()
+        self.flush()
 
 
 class StreamDecoder:
@@ -286,27 +757,123 @@ class StreamDecoder:
         ...             process(obj)
     """
     
+    __slots__ = ('fp', 'decoder', '_hdr', '_buf', '_queue', '_readinto')
+    
     def __init__(self, fp: BinaryIO, **kwargs):
         self.fp = fp
+        # Streams with only read() (and no readinto) are supported too
+        self._readinto = getattr(fp, 'readinto', None)
         self.decoder = Decoder(**kwargs)
+        # Objects from a block frame not yet returned by __next__
+        self._queue = deque()
+        # Reused across frames; _buf grows to the largest frame seen
+        self._hdr = bytearray(4)
+        self._buf = bytearray(65536)
     
     def __iter__(self):
         return self
     
     def __next__(self) -> Any:
         """Read next object from stream."""
+        if self._queue:
+            return self._queue.popleft()
+        
         # Read length prefix
-        length_bytes = self.fp.read(4)
-        if not length_bytes:
+        n = self._fill(memoryview(self._hdr))
+        if not n:
             raise StopIteration
+        if n < 4:
+            raise BtoonException("Incomplete data in stream")
         
-        length = int.from_bytes(length_bytes, 'big')
-        data = self.fp.read(length)
+        (length,) = _HDR.unpack(self._hdr)
+        if length > len(self._buf):
+            self._buf = bytearray(length)
+        data = memoryview(self._buf)[:length]
         
-        if len(data) < length:
+        if self._fill(data) < length:
             raise BtoonException("Incomplete data in stream")
         
-        return self.decoder.decode(data)
+        obj = self.decoder.decode(data)
+        if _is_block(obj):
+            self._queue.extend(self._expand(obj))
+            return self._queue.popleft()
+        return obj
+    
+    def _fill(self, view: memoryview) -> int:
+        """
+        Read into ``view`` until it is full or the stream ends.
+        
+        Pipes, sockets and raw files may return fewer bytes than asked
+        for; only an empty read means end of stream. Returns the number
+        of bytes read.
+        """
+        filled = 0
+        while filled < len(view):
+            if self._readinto is not None:
+                n = self._readinto(view[filled:])
+            else:
+                chunk = self.fp.read(len(view) - filled)
+                n = len(chunk) if chunk else 0
+                view[filled:filled + n] = chunk
+            if not n:
+                break
+            filled += n
+        return filled
+    
+    def iter_frames_fast(self):
+        """
+        Decode all remaining frames from a single read of the stream.
+        
+        Reads the rest of the file once and hands zero-copy memoryview
+        slices of each frame to the decoder, instead of two reads and two
+        allocations per frame.
+        
+        Example:
+            >>> with open('large.btoon', 'rb') as f:
+            ...     for obj in StreamDecoder(f).iter_frames_fast():
+            ...         process(obj)
+        """
+        for frame in self._iter_frame_views():
+            yield from self._expand(self.decoder.decode(frame))
+    
+    def iter_parallel(self, n_workers: Optional[int] = None):
+        """
+        Decode remaining frames on a thread pool, yielding in stream order.
+        
+        Frames are independent, so payloads are decoded concurrently (the
+        native decoder releases the GIL) while headers are scanned here.
+        
+        Args:
+            n_workers: Number of decode threads (default: CPU count)
+        
+        Example:
+            >>> with open('large.btoon', 'rb') as f:
+            ...     for obj in StreamDecoder(f).iter_parallel(8):
+            ...         process(obj)
+        """
+        n_workers = n_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            # Bound the number of in-flight frames to keep memory flat
+            window = n_workers * 4
+            pending = deque()
+            for frame in self._iter_frame_views():
+                pending.append(pool.submit(self.decoder.decode, frame))
+                if len(pending) >= window:
+                    yield from self._expand(pending.popleft().result())
+            while pending:
+                yield from self._expand(pending.popleft().result())
+    
+    def _expand(self, obj: Any):
+        """Yield the objects of a block frame, or ``obj`` itself."""
+        if not _is_block(obj):
+            yield obj
+            return
+        for frame in _frame_views(memoryview(obj[1])):
+            yield self.decoder.decode(frame)
+    
+    def _iter_frame_views(self):
+        """Read the rest of the stream once and yield each frame payload."""
+        return _frame_views(memoryview(self.fp.read()))
     
     def __enter__(self):
         return self
@@ -315,38 +882,95 @@ class StreamDecoder:
         pass
 
 
+# Reserved system extension type carrying a StreamEncoder block of
+# frames; out of band, so no user record can be mistaken for a block
+_BLOCK_EXT_TYPE = -11
+
+
+def _is_block(obj: Any) -> bool:
+    """Whether a decoded frame is a block (an extension decodes as (type, data))."""
+    return type(obj) is tuple and obj[0] == _BLOCK_EXT_TYPE
+
+
+def _frame_views(mv: memoryview):
+    """Yield each ``[u32 length][payload]`` frame payload in ``mv``."""
+    end = len(mv)
+    offset = 0
+    while offset < end:
+        if end - offset < 4:
+            raise BtoonException("Incomplete data in stream")
+        (length,) = _HDR.unpack_from(mv, offset)
+        offset += 4
+        if offset + length > end:
+            raise BtoonException("Incomplete data in stream")
+        yield mv[offset:offset + length]
+        offset += length
+
+
 # Convenience functions for common use cases
 
-def to_json(data: bytes, **kwargs) -> str:
+def to_json(data: Union[bytes, List[bytes]], **kwargs) -> Union[str, List[str]]:
     """
     Convert BTOON to JSON string.
     
+    Without JSON encoder options the payload is transcoded natively,
+    skipping the intermediate Python objects; the text is the same as
+    ``json.dumps`` produces, which is used for values the native path
+    cannot render identically.
+    
     Args:
-        data: BTOON bytes
+        data: BTOON bytes, or a list of payloads to convert in one batch
         **kwargs: JSON encoder options
     
     Returns:
-        JSON string
+        JSON string (list of strings when given a list)
     """
-    import json
+    if not kwargs:
+        if isinstance(data, list):
+            return [_json_text(d) for d in data]
+        return _json_text(data)
+    if isinstance(data, list):
+        return [json.dumps(obj, **kwargs) for obj in loads_many(data)]
     obj = loads(data)
     return json.dumps(obj, **kwargs)
 
 
-def from_json(json_str: str, **kwargs) -> bytes:
+def from_json(json_str: Union[str, List[str]], **kwargs) -> Union[bytes, List[bytes]]:
     """
     Convert JSON string to BTOON.
     
     Args:
-        json_str: JSON string
-        **kwargs: BTOON encoder options
+        json_str: JSON string, or a list of strings to convert in one batch
+        **kwargs: BTOON encoder options, as for ``dumps``
     
     Returns:
-        BTOON bytes
+        BTOON bytes (list of bytes when given a list)
     """
-    import json
-    obj = json.loads(json_str)
-    return dumps(obj, **kwargs)
+    if isinstance(json_str, list):
+        return [_json_payload(s, **kwargs) for s in json_str]
+    return _json_payload(json_str, **kwargs)
+
+
+def _json_text(data: bytes) -> str:
+    text = _native.transcode_to_json(data)
+    if text is None:
+        # Binary, extensions, invalid UTF-8 ...: json.dumps decides
+        return json.dumps(loads(data))
+    return text.decode('ascii')
+
+
+# dumps() options the native JSON transcoder also takes
+_NATIVE_JSON_OPTIONS = frozenset(('compress', 'compression'))
+
+
+def _json_payload(json_str: str, **kwargs) -> bytes:
+    payload = None
+    if _NATIVE_JSON_OPTIONS.issuperset(kwargs):
+        payload = _native.transcode_from_json(json_str, **kwargs)
+    if payload is None:
+        # NaN/Infinity, integers wider than 64 bits ...: json.loads decides
+        return dumps(json.loads(json_str), **kwargs)
+    return payload
 
 
 def validate_file(path: Union[str, pathlib.Path],
@@ -363,7 +987,7 @@ def validate_file(path: Union[str, pathlib.Path],
     Returns:
         Validation result dict
     """
-    path = pathlib.Path(path)
+    path = os.fspath(path)
     validator = Validator(strict=strict)
     
     with open(path, 'rb') as f:
@@ -8,12 +8,16 @@ from decimal import Decimal as PyDecimal
 from pathlib import Path
 from contextlib import contextmanager, asynccontextmanager
 from enum import Enum
+from functools import lru_cache
 import asyncio
 import json
 import io
 import struct
+import time
 import warnings
+import weakref
 from dataclasses import dataclass
+from collections import deque
 from collections.abc import Mapping, Sequence
 
 try:
@@ -29,7 +33,20 @@ except ImportError:
     HAS_PANDAS = False
 
 # Import the C++ bindings
-from _btoon_core import *
+from btoon._btoon_native import *
+
+try:
+    from btoon._btoon_native import _convert_encode, _convert_decode
+except ImportError:
+    _convert_encode = _convert_decode = None
+
+try:
+    from btoon._btoon_native import read_all_frames as _read_all_frames
+except ImportError:
+    _read_all_frames = None
+
+# DataFrame layout shared with btoon.dumps_dataframe/loads_dataframe
+from btoon import _array_buffer, _dataframe_payload, _dataframe_from_payload
 
 __version__ = "0.0.1"
 __all__ = [
@@ -38,7 +55,7 @@ __all__ = [
     # Classes
     'Encoder', 'Decoder', 'StreamEncoder', 'StreamDecoder',
     'Schema', 'SchemaBuilder', 'Validator',
-    'Timestamp', 'Decimal', 'Currency',
+    'Timestamp', 'Decimal', 'Currency', 'CurrencyArray',
     # Compression
     'CompressionAlgorithm', 'CompressionLevel', 'CompressionProfile',
     # Context managers
@@ -71,6 +88,15 @@ class CompressionLevel(Enum):
 
 # ============= Enhanced Timestamp =============
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+
+# Native timestamp extension payload: seconds, nanoseconds[, tz minutes]
+_TIMESTAMP_EXT_TYPE = -1
+_DECIMAL_EXT_TYPE = -7
+_TS_STRUCT = struct.Struct('>qI')
+_TS_TZ_STRUCT = struct.Struct('>qIh')
+
 class Timestamp:
     """
     Enhanced timestamp with nanosecond precision and timezone support.
@@ -93,50 +119,56 @@ class Timestamp:
     @classmethod
     def now(cls, tz: Optional[timezone] = None) -> 'Timestamp':
         """Get current timestamp."""
-        dt = datetime.now(tz or timezone.utc)
-        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
-        delta = dt - epoch
-        
-        seconds = int(delta.total_seconds())
-        nanoseconds = delta.microseconds * 1000
+        seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
         
         tz_offset = None
         if tz:
-            offset = tz.utcoffset(dt)
+            offset = tz.utcoffset(datetime.fromtimestamp(seconds, tz))
             if offset:
-                tz_offset = int(offset.total_seconds() / 60)
+                tz_offset = offset.days * 1440 + offset.seconds // 60
                 
         return cls(seconds, nanoseconds, tz_offset)
     
     @classmethod
     def from_datetime(cls, dt: datetime) -> 'Timestamp':
-        """Convert from Python datetime."""
-        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        
-        delta = dt - epoch
-        seconds = int(delta.total_seconds())
+        """Convert from Python datetime (naive values are taken as UTC)."""
+        offset = dt.utcoffset()
+        delta = dt - (_EPOCH_NAIVE if offset is None else _EPOCH)
+        seconds = delta.days * 86400 + delta.seconds
         nanoseconds = delta.microseconds * 1000
         
         tz_offset = None
-        if dt.tzinfo:
-            offset = dt.tzinfo.utcoffset(dt)
-            if offset:
-                tz_offset = int(offset.total_seconds() / 60)
+        if offset is not None:
+            tz_offset = offset.days * 1440 + offset.seconds // 60
                 
         return cls(seconds, nanoseconds, tz_offset)
     
-    def to_datetime(self) -> datetime:
-        """Convert to Python datetime."""
-        dt = datetime.fromtimestamp(self.seconds, tz=timezone.utc)
-        dt = dt.replace(microsecond=self.nanoseconds // 1000)
+    def to_bytes(self) -> bytes:
+        """
+        Pack into the native timestamp extension payload.
         
-        if self.timezone_offset is not None:
-            tz = timezone(timedelta(minutes=self.timezone_offset))
-            dt = dt.astimezone(tz)
-            
-        return dt
+        Big-endian int64 seconds and uint32 nanoseconds, followed by an
+        int16 offset in minutes when a timezone is set (12 or 14 bytes).
+        """
+        if self.timezone_offset is None:
+            return _TS_STRUCT.pack(self.seconds, self.nanoseconds)
+        return _TS_TZ_STRUCT.pack(self.seconds, self.nanoseconds, self.timezone_offset)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Timestamp':
+        """Unpack a payload produced by to_bytes()."""
+        if len(data) == _TS_STRUCT.size:
+            return cls(*_TS_STRUCT.unpack(data))
+        if len(data) == _TS_TZ_STRUCT.size:
+            return cls(*_TS_TZ_STRUCT.unpack(data))
+        raise ValueError(f"Invalid timestamp payload length: {len(data)}")
+    
+    def to_datetime(self) -> datetime:
+        """Convert to Python datetime (in UTC when no timezone is set)."""
+        dt = _EPOCH + timedelta(seconds=self.seconds, microseconds=self.nanoseconds // 1000)
+        if self.timezone_offset is None:
+            return dt
+        return dt.astimezone(timezone(timedelta(minutes=self.timezone_offset)))
     
     def __repr__(self) -> str:
         return f"Timestamp({self.seconds}, {self.nanoseconds}, {self.timezone_offset})"
@@ -198,42 +230,190 @@ class Currency(Decimal):
         self.currency_code = currency_code
         self.precision = precision
         # Round to specified precision
-        self._value = self._value.quantize(PyDecimal(10) ** -precision)
+        self._value = self._value.quantize(_quantum(precision))
     
     def __repr__(self) -> str:
         return f"Currency('{self._value}', '{self.currency_code}')"
     
+    @classmethod
+    def from_array(cls, amounts: Any, currency_code: str = "USD",
+                   precision: int = 2) -> 'CurrencyArray':
+        """Round a batch of amounts at once, without a Currency per value."""
+        return CurrencyArray(amounts, currency_code, precision)
+    
     def format(self, with_symbol: bool = True) -> str:
         """Format currency for display."""
-        symbols = {
-            "USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥",
-            "CNY": "¥", "INR": "₹", "KRW": "₩", "BTC": "₿"
-        }
-        symbol = symbols.get(self.currency_code, self.currency_code + " ")
+        symbol = _CURRENCY_SYMBOLS.get(self.currency_code, self.currency_code + " ")
         
         if with_symbol:
             return f"{symbol}{self._value:,.{self.precision}f}"
         else:
             return f"{self._value:,.{self.precision}f}"
 
+_CURRENCY_SYMBOLS = {
+    "USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥",
+    "CNY": "¥", "INR": "₹", "KRW": "₩", "BTC": "₿"
+}
+
+@lru_cache(maxsize=None)
+def _quantum(precision: int) -> PyDecimal:
+    return PyDecimal(1).scaleb(-precision)
+
+class CurrencyArray:
+    """
+    Amounts in one currency stored as an int64 array of minor units.
+    
+    Rounding, arithmetic and encoding are single numpy operations;
+    Currency objects are only created when elements are accessed.
+    """
+    
+    def __init__(self, amounts: Any, currency_code: str = "USD", precision: int = 2):
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for CurrencyArray")
+        amounts = np.asarray(amounts)
+        scale = 10 ** precision
+        if amounts.dtype.kind in "iu":
+            self.units = amounts.astype(np.int64) * scale
+        else:
+            self.units = np.round(amounts.astype(np.float64) * scale).astype(np.int64)
+        self.currency_code = currency_code
+        self.precision = precision
+    
+    @classmethod
+    def from_units(cls, units: Any, currency_code: str = "USD",
+                   precision: int = 2) -> 'CurrencyArray':
+        """Wrap integer minor units (e.g. cents) without rescaling."""
+        arr = cls.__new__(cls)
+        arr.units = np.asarray(units, dtype=np.int64)
+        arr.currency_code = currency_code
+        arr.precision = precision
+        return arr
+    
+    @property
+    def values(self) -> np.ndarray:
+        """Amounts as float64."""
+        return self.units / 10 ** self.precision
+    
+    def __len__(self) -> int:
+        return len(self.units)
+    
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, (int, np.integer)):
+            amount = PyDecimal(int(self.units[key])).scaleb(-self.precision)
+            return Currency(amount, self.currency_code, self.precision)
+        return CurrencyArray.from_units(self.units[key], self.currency_code, self.precision)
+    
+    def __iter__(self):
+        for i in range(len(self.units)):
+            yield self[i]
+    
+    def __repr__(self) -> str:
+        return f"CurrencyArray({len(self.units)} x {self.currency_code}, precision={self.precision})"
+    
+    def format(self, with_symbol: bool = True) -> List[str]:
+        """Format every amount like Currency.format, using integer math."""
+        symbol = _CURRENCY_SYMBOLS.get(self.currency_code, self.currency_code + " ")
+        prefix = symbol if with_symbol else ""
+        scale = 10 ** self.precision
+        p = self.precision
+        out = []
+        for units in self.units.tolist():
+            sign = "-" if units < 0 else ""
+            whole, frac = divmod(abs(units), scale)
+            if p:
+                out.append(f"{prefix}{sign}{whole:,}.{frac:0{p}d}")
+            else:
+                out.append(f"{prefix}{sign}{whole:,}")
+        return out
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for encoding."""
+        return {
+            "__currency_array__": {
+                "code": self.currency_code,
+                "precision": self.precision,
+                "units": _array_buffer(np.ascontiguousarray(self.units, dtype="<i8"))
+            }
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CurrencyArray':
+        """Create from dictionary."""
+        data = data["__currency_array__"]
+        return cls.from_units(np.frombuffer(data["units"], dtype="<i8"),
+                              data["code"], data["precision"])
+
 # ============= Enhanced Encoder/Decoder =============
 
+# Types passed through to the native encoder unchanged
+_LEAF_TYPES = frozenset({int, float, str, bytes, bool, type(None), PyDecimal, Extension})
+
+# Markers for container types in _DISPATCH
+_MAPPING = object()
+_SEQUENCE = object()
+
+def _convert_datetime(encoder: 'EnhancedEncoder', dt: datetime) -> Extension:
+    return Extension(_TIMESTAMP_EXT_TYPE, Timestamp.from_datetime(dt).to_bytes())
+
+def _convert_timestamp(encoder: 'EnhancedEncoder', ts: Timestamp) -> Extension:
+    return Extension(_TIMESTAMP_EXT_TYPE, ts.to_bytes())
+
+def _convert_currency_array(encoder: 'EnhancedEncoder', arr: CurrencyArray) -> Dict[str, Any]:
+    return arr.to_dict()
+
+def _convert_decimal(encoder: 'EnhancedEncoder', dec: Decimal) -> PyDecimal:
+    # The native encoder writes decimal.Decimal as a binary extension
+    # (sign, exponent, coefficient bytes) instead of a {"__decimal__": str} map
+    return dec.value
+
+def _dispatch_slow(obj: Any) -> Any:
+    """Resolve a handler by isinstance for types not in _DISPATCH (subclasses)."""
+    if isinstance(obj, datetime):
+        return _convert_datetime
+    if isinstance(obj, Timestamp):
+        return _convert_timestamp
+    if isinstance(obj, Decimal):
+        return _convert_decimal
+    if isinstance(obj, CurrencyArray):
+        return _convert_currency_array
+    if HAS_NUMPY and isinstance(obj, np.ndarray):
+        return EnhancedEncoder._encode_numpy
+    if HAS_PANDAS and isinstance(obj, pd.DataFrame):
+        return EnhancedEncoder._encode_dataframe
+    if isinstance(obj, Mapping):
+        return _MAPPING
+    if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
+        return _SEQUENCE
+    return None
+
 class EnhancedEncoder:
     """
     Enhanced encoder with additional Python types support.
     """
     
     def __init__(self, compression: Optional[CompressionAlgorithm] = None,
-                 compression_level: CompressionLevel = CompressionLevel.BALANCED):
+                 compression_level: CompressionLevel = CompressionLevel.BALANCED,
+                 dictionary: Optional[bytes] = None):
         self.compression = compression
         self.compression_level = compression_level
+        self.dictionary = dictionary
+        # Native encoder built once and reused for every encode() call.
+        # AUTO picks LZ4 below 4 KB and ZSTD above; a dictionary (see
+        # Encoder.train_dictionary) is loaded into the ZSTD context.
+        if compression:
+            self._encoder = Encoder(compress=True,
+                                    algorithm=compression.name.lower(),
+                                    level=compression_level.value,
+                                    dictionary=dictionary or b"")
+        else:
+            self._encoder = Encoder()
         
     def encode(self, obj: Any) -> bytes:
         """
         Encode Python object to BTOON.
         
         Supports additional types:
-        - datetime -> Timestamp
+        - datetime / Timestamp -> native timestamp extension
         - Decimal -> encoded as extension
         - numpy arrays -> optimized encoding
         - pandas DataFrames -> tabular encoding
@@ -241,111 +421,270 @@ class EnhancedEncoder:
         # Convert Python types to BTOON-compatible types
         converted = self._convert_python_types(obj)
         
-        # Use base encoder
-        options = {}
-        if self.compression:
-            options['compress'] = True
-            options['compression_algorithm'] = self.compression.value
-            options['compression_level'] = self.compression_level.value
-            
-        return encode(converted, **options)
+        return self._encoder.encode(converted)
+    
+    def encode_into(self, obj: Any, buf: bytearray, offset: int = 0) -> int:
+        """
+        Encode into ``buf`` starting at ``offset``, resizing it to fit.
+        
+        Returns:
+            Number of encoded bytes
+        """
+        return self._encoder.encode_into(self._convert_python_types(obj), buf, offset)
     
     def _convert_python_types(self, obj: Any) -> Any:
-        """Convert Python-specific types to BTOON types."""
-        # Handle datetime
-        if isinstance(obj, datetime):
-            return Timestamp.from_datetime(obj).to_dict()
-        
-        # Handle Decimal
-        if isinstance(obj, (Decimal, Currency)):
-            return obj.to_dict()
-        
-        # Handle numpy arrays
-        if HAS_NUMPY and isinstance(obj, np.ndarray):
-            return self._encode_numpy(obj)
-        
-        # Handle pandas DataFrames
-        if HAS_PANDAS and isinstance(obj, pd.DataFrame):
-            return self._encode_dataframe(obj)
-        
-        # Handle collections recursively
-        if isinstance(obj, Mapping):
-            return {k: self._convert_python_types(v) for k, v in obj.items()}
-        if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
-            return [self._convert_python_types(item) for item in obj]
+        """
+        Convert Python-specific types to BTOON types.
+        
+        Walks the tree with an explicit stack, dispatching on exact type
+        and only falling back to isinstance checks for subclasses. The
+        native extension performs the same walk in C++ when available.
+        """
+        if _convert_encode is not None:
+            return _convert_encode(obj, self, _DISPATCH, _dispatch_slow,
+                                   _MAPPING, _SEQUENCE, _LIST_DISPATCH)
+        
+        root = [obj]
+        stack = [(root, 0, obj)]
+        while stack:
+            parent, key, value = stack.pop()
+            cls = type(value)
+            if cls in _LEAF_TYPES:
+                continue
+            handler = _DISPATCH.get(cls)
+            if handler is None:
+                handler = _dispatch_slow(value)
+                if handler is None:
+                    continue
             
-        return obj
+            if handler is _MAPPING:
+                out = {}
+                for k, v in value.items():
+                    out[k] = v
+                    if type(v) not in _LEAF_TYPES:
+                        stack.append((out, k, v))
+            elif handler is _SEQUENCE:
+                if cls is list and len(value) > 1:
+                    list_handler = _LIST_DISPATCH.get(type(value[0]))
+                    if list_handler is not None:
+                        out = list_handler(self, value)
+                        if out is not None:
+                            parent[key] = out
+                            continue
+                out = list(value)
+                for i, v in enumerate(out):
+                    if type(v) not in _LEAF_TYPES:
+                        stack.append((out, i, v))
+            else:
+                out = handler(self, value)
+            parent[key] = out
+        return root[0]
     
     def _encode_numpy(self, arr: np.ndarray) -> Dict[str, Any]:
-        """Encode numpy array efficiently."""
+        """
+        Encode numpy array efficiently.
+        
+        C- and Fortran-contiguous arrays are handed to the native encoder
+        as a memoryview over their own memory rather than a tobytes() copy.
+        A Fortran array's buffer is flagged with "layout": "F"; "order"
+        keeps its original meaning (C-order bytes), so it is not written
+        for those and readers unaware of "layout" fail instead of
+        misreading the data.
+        """
+        if arr.flags['F_CONTIGUOUS'] and not arr.flags['C_CONTIGUOUS']:
+            # The transpose of a Fortran array is C-contiguous over the same memory
+            return {
+                "__numpy__": {
+                    "shape": arr.shape,
+                    "dtype": str(arr.dtype),
+                    "data": _array_buffer(arr.T),
+                    "layout": "F"
+                }
+            }
+        if not arr.flags['C_CONTIGUOUS']:
+            arr = np.ascontiguousarray(arr)
         return {
             "__numpy__": {
                 "shape": arr.shape,
                 "dtype": str(arr.dtype),
-                "data": arr.tobytes(),
-                "order": "C" if arr.flags['C_CONTIGUOUS'] else "F"
+                "data": _array_buffer(arr),
+                "order": "C"
             }
         }
     
-    def _encode_dataframe(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Encode pandas DataFrame as tabular data."""
+    def _encode_numpy_stack(self, arrays: List[np.ndarray]) -> Optional[Dict[str, Any]]:
+        """
+        Encode a list of same-shape, same-dtype arrays as one stacked block.
+        
+        Returns None (encode element by element) if the list is not homogeneous.
+        """
+        first = arrays[0]
+        dtype, shape = first.dtype, first.shape
+        for arr in arrays:
+            if type(arr) is not np.ndarray or arr.dtype != dtype or arr.shape != shape:
+                return None
         return {
-            "__dataframe__": {
-                "columns": df.columns.tolist(),
-                "index": df.index.tolist(),
-                "data": df.to_dict('records')
+            "__numpy_stack__": {
+                "count": len(arrays),
+                "shape": shape,
+                "dtype": str(dtype),
+                "data": _array_buffer(np.stack(arrays)),
             }
         }
+    
+    def _encode_dataframe(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Encode pandas DataFrame as tabular data.
+        
+        Uses the same column layout as btoon.dumps_dataframe.
+        """
+        return {"__dataframe__": _dataframe_payload(df)}
+
+@lru_cache(maxsize=32)
+def _get_encoder(options: tuple) -> EnhancedEncoder:
+    return EnhancedEncoder(**dict(options))
+
+def _encoder_for(options: Dict[str, Any]) -> EnhancedEncoder:
+    """Shared EnhancedEncoder for an option set (options must be hashable)."""
+    return _get_encoder(tuple(sorted(options.items())))
+
+_DISPATCH = {
+    dict: _MAPPING,
+    list: _SEQUENCE,
+    tuple: _SEQUENCE,
+    datetime: _convert_datetime,
+    Timestamp: _convert_timestamp,
+    Extension: None,
+    Decimal: _convert_decimal,
+    Currency: _convert_decimal,
+    PyDecimal: None,
+    CurrencyArray: _convert_currency_array,
+}
+if HAS_NUMPY:
+    _DISPATCH[np.ndarray] = EnhancedEncoder._encode_numpy
+
+# Handlers offered whole lists keyed by the type of their first item
+_LIST_DISPATCH = {}
+if HAS_NUMPY:
+    _LIST_DISPATCH[np.ndarray] = EnhancedEncoder._encode_numpy_stack
+if HAS_PANDAS:
+    _DISPATCH[pd.DataFrame] = EnhancedEncoder._encode_dataframe
 
 class EnhancedDecoder:
     """
     Enhanced decoder with Python types reconstruction.
+    
+    Special types are rebuilt by the native decoder while it constructs
+    the result, so no second pass over the decoded tree is needed.
     """
     
+    def __init__(self, **options):
+        markers = {key: self._marker_hook(key, handler)
+                   for key, handler in _DECODE_MARKERS.items()}
+        self._decoder = Decoder(markers=markers, ext_hooks=_DECODE_EXTENSIONS, **options)
+    
+    def _marker_hook(self, key: str, handler):
+        # The native Decoder isn't tracked by the garbage collector, so a
+        # hook holding self would keep this decoder alive forever
+        ref = weakref.ref(self)
+        return lambda payload: handler(ref(), {key: payload})
+    
     def decode(self, data: bytes) -> Any:
         """Decode BTOON data to Python objects."""
-        # Use base decoder
-        obj = decode(data)
-        
-        # Convert to Python types
-        return self._convert_to_python_types(obj)
+        return self._decoder.decode(data)
+    
+    def read_frames(self, path: Union[str, Path]) -> List[Any]:
+        """Decode every length-prefixed frame in a file via a memory map."""
+        return self._decoder.read_frames(str(path))
     
     def _convert_to_python_types(self, obj: Any) -> Any:
-        """Convert BTOON types to Python types."""
+        """Convert BTOON types to Python types.
+        
+        Deprecated: only needed for trees decoded without this decoder's
+        hooks, which cost a full walk of the result.
+        """
+        warnings.warn("_convert_to_python_types is deprecated; decode with "
+                      "EnhancedDecoder instead", DeprecationWarning, stacklevel=2)
+        return self._convert_tree(obj)
+    
+    def _convert_tree(self, obj: Any) -> Any:
+        if _convert_decode is not None:
+            return _convert_decode(obj, self, _DECODE_MARKERS, _DECODE_LEAVES)
+        
         if isinstance(obj, dict):
             # Check for special types
             if "__decimal__" in obj:
                 return Decimal.from_dict(obj)
+            if "__currency_array__" in obj and HAS_NUMPY:
+                return CurrencyArray.from_dict(obj)
             if "__numpy__" in obj and HAS_NUMPY:
                 return self._decode_numpy(obj["__numpy__"])
+            if "__numpy_stack__" in obj and HAS_NUMPY:
+                return self._decode_numpy_stack(obj["__numpy_stack__"])
             if "__dataframe__" in obj and HAS_PANDAS:
                 return self._decode_dataframe(obj["__dataframe__"])
             
             # Recurse for regular dicts
-            return {k: self._convert_to_python_types(v) for k, v in obj.items()}
+            return {k: self._convert_tree(v) for k, v in obj.items()}
             
         if isinstance(obj, list):
-            return [self._convert_to_python_types(item) for item in obj]
-            
+            return [self._convert_tree(item) for item in obj]
+        
+        handler = _DECODE_LEAVES.get(type(obj))
+        if handler is not None:
+            return handler(obj)
         return obj
     
     def _decode_numpy(self, data: Dict[str, Any]) -> np.ndarray:
         """Decode numpy array."""
         arr = np.frombuffer(data["data"], dtype=data["dtype"])
+        if data.get("layout") == "F":
+            # Fortran-layout buffer: viewed through its transpose, then copied
+            # once (a plain memcpy) so the result is writable as it always was
+            return arr.reshape(list(data["shape"])[::-1]).T.copy(order="F")
         arr = arr.reshape(data["shape"])
-        if data["order"] == "F":
+        if data.get("order") == "F":
+            # C-order bytes of an array that was Fortran-ordered
             arr = np.asfortranarray(arr)
         return arr
     
+    def _decode_numpy_stack(self, data: Dict[str, Any]) -> List[np.ndarray]:
+        """Decode a stacked block into a list of views over one buffer."""
+        block = np.frombuffer(data["data"], dtype=data["dtype"])
+        return list(block.reshape([data["count"]] + list(data["shape"])))
+    
     def _decode_dataframe(self, data: Dict[str, Any]) -> pd.DataFrame:
         """Decode pandas DataFrame."""
-        df = pd.DataFrame(data["data"], columns=data["columns"])
-        if data["index"]:
-            df.index = data["index"]
-        return df
+        return _dataframe_from_payload(data)
+
+# Special-type marker keys, in the order _convert_tree checks them
+_DECODE_MARKERS = {"__decimal__": lambda decoder, obj: Decimal.from_dict(obj)}
+if HAS_NUMPY:
+    _DECODE_MARKERS["__currency_array__"] = lambda decoder, obj: CurrencyArray.from_dict(obj)
+    _DECODE_MARKERS["__numpy__"] = lambda decoder, obj: decoder._decode_numpy(obj["__numpy__"])
+    _DECODE_MARKERS["__numpy_stack__"] = lambda decoder, obj: decoder._decode_numpy_stack(obj["__numpy_stack__"])
+if HAS_PANDAS:
+    _DECODE_MARKERS["__dataframe__"] = lambda decoder, obj: decoder._decode_dataframe(obj["__dataframe__"])
+
+# Decoded leaf types rebuilt as enhanced types (binary decimal extension)
+_DECODE_LEAVES = {PyDecimal: Decimal}
+
+# Extension type ids rebuilt as enhanced types during native decode
+_DECODE_EXTENSIONS = {_DECIMAL_EXT_TYPE: Decimal}
+
+@lru_cache(maxsize=1)
+def _get_decoder() -> EnhancedDecoder:
+    """Shared EnhancedDecoder with default options."""
+    return EnhancedDecoder()
 
 # ============= Async Streaming =============
 
+# Big-endian u32 length prefix of stream frames
+_LEN = struct.Struct('>I')
+
+# Recycled output buffers for AsyncStreamEncoder.write
+_BUF_POOL = deque(maxlen=64)
+
 class AsyncStreamEncoder:
     """
     Asynchronous streaming encoder.
@@ -354,18 +693,22 @@ class AsyncStreamEncoder:
     def __init__(self, writer: asyncio.StreamWriter, **options):
         self.writer = writer
         self.options = options
+        self.encoder = _encoder_for(options)
         
     async def write(self, obj: Any) -> None:
         """Write object to stream."""
-        encoder = EnhancedEncoder(**self.options)
-        data = encoder.encode(obj)
+        buf = _BUF_POOL.pop() if _BUF_POOL else bytearray(4096)
         
-        # Write length prefix
-        length = len(data)
-        self.writer.write(struct.pack('>I', length))
-        self.writer.write(data)
+        # Encode after a 4-byte gap, then fill in the length prefix
+        length = self.encoder.encode_into(obj, buf, 4)
+        _LEN.pack_into(buf, 0, length)
+        self.writer.write(memoryview(buf)[:length + 4])
         await self.writer.drain()
         
+        # Only recycle once the transport no longer holds any of our data
+        if self.writer.transport.get_write_buffer_size() == 0:
+            _BUF_POOL.append(buf)
+        
     async def close(self) -> None:
         """Close the stream."""
         self.writer.close()
@@ -383,17 +726,21 @@ class AsyncStreamDecoder:
     async def __aiter__(self) -> AsyncIterator[Any]:
         """Iterate over stream objects."""
         while True:
-            # Read length prefix
-            length_data = await self.reader.read(4)
-            if not length_data:
-                break
+            # Read length prefix; read() may return short on a segmented socket
+            try:
+                length_data = await self.reader.readexactly(4)
+            except asyncio.IncompleteReadError as e:
+                if not e.partial:
+                    break
+                raise IOError("Incomplete read from stream") from e
                 
-            length = struct.unpack('>I', length_data)[0]
+            (length,) = _LEN.unpack(length_data)
             
             # Read data
-            data = await self.reader.read(length)
-            if len(data) != length:
-                raise IOError("Incomplete read from stream")
+            try:
+                data = await self.reader.readexactly(length)
+            except asyncio.IncompleteReadError as e:
+                raise IOError("Incomplete read from stream") from e
                 
             yield self.decoder.decode(data)
 
@@ -440,39 +787,50 @@ def open_btoon(path: Union[str, Path], mode: str = 'r', **options):
     
     if 'r' in mode:
         with open(path, 'rb') as f:
-            decoder = EnhancedDecoder()
+            decoder = _get_decoder()
             
             class Reader:
                 def read(self):
                     return decoder.decode(f.read())
                 
                 def read_all(self):
+                    if _read_all_frames is not None and f.tell() == 0:
+                        # Decode the whole memory-mapped file in one native call
+                        return decoder.read_frames(path)
+                    
                     results = []
                     while True:
-                        try:
-                            # Read length-prefixed messages
-                            length_data = f.read(4)
-                            if not length_data:
-                                break
-                            length = struct.unpack('>I', length_data)[0]
-                            data = f.read(length)
-                            results.append(decoder.decode(data))
-                        except:
+                        # Read length-prefixed messages
+                        length_data = f.read(4)
+                        if not length_data:
                             break
+                        if len(length_data) < 4:
+                            raise IOError("Truncated BTOON frame header")
+                        (length,) = _LEN.unpack(length_data)
+                        data = f.read(length)
+                        if len(data) < length:
+                            raise IOError("Truncated BTOON frame payload")
+                        results.append(decoder.decode(data))
                     return results
             
             yield Reader()
     else:
         with open(path, 'wb' if 'w' in mode else 'ab') as f:
-            encoder = EnhancedEncoder(**options)
+            streaming = options.pop('streaming', False)
+            encoder = _encoder_for(options)
             
             class Writer:
+                # Reused frame buffer: length prefix + payload
+                _frame = bytearray()
+                
                 def write(self, obj):
-                    data = encoder.encode(obj)
-                    if options.get('streaming', False):
-                        # Write with length prefix for streaming
-                        f.write(struct.pack('>I', len(data)))
-                    f.write(data)
+                    if streaming:
+                        # Write with length prefix for streaming, as one write
+                        length = encoder.encode_into(obj, self._frame, 4)
+                        _LEN.pack_into(self._frame, 0, length)
+                        f.write(self._frame)
+                    else:
+                        f.write(encoder.encode(obj))
                     
                 def write_many(self, objects):
                     for obj in objects:
@@ -490,7 +848,7 @@ def from_dataframe(df: pd.DataFrame, **options) -> bytes:
         raise ImportError("pandas is required for DataFrame support")
         
     options['use_tabular'] = True
-    encoder = EnhancedEncoder(**options)
+    encoder = _encoder_for(options)
     return encoder.encode(df)
 
 def to_dataframe(data: bytes) -> pd.DataFrame:
@@ -500,7 +858,7 @@ def to_dataframe(data: bytes) -> pd.DataFrame:
     if not HAS_PANDAS:
         raise ImportError("pandas is required for DataFrame support")
         
-    decoder = EnhancedDecoder()
+    decoder = _get_decoder()
     obj = decoder.decode(data)
     
     if isinstance(obj, pd.DataFrame):
@@ -522,7 +880,7 @@ def from_numpy(arr: np.ndarray, **options) -> bytes:
     if not HAS_NUMPY:
         raise ImportError("numpy is required for array support")
         
-    encoder = EnhancedEncoder(**options)
+    encoder = _encoder_for(options)
     return encoder.encode(arr)
 
 def to_numpy(data: bytes, dtype: Optional[np.dtype] = None) -> np.ndarray:
@@ -532,7 +890,7 @@ def to_numpy(data: bytes, dtype: Optional[np.dtype] = None) -> np.ndarray:
     if not HAS_NUMPY:
         raise ImportError("numpy is required for array support")
         
-    decoder = EnhancedDecoder()
+    decoder = _get_decoder()
     obj = decoder.decode(data)
     
     if isinstance(obj, np.ndarray):
@@ -552,13 +910,12 @@ def to_numpy(data: bytes, dtype: Optional[np.dtype] = None) -> np.ndarray:
 
 def dumps(obj: Any, **options) -> bytes:
     """Serialize object to BTOON bytes."""
-    encoder = EnhancedEncoder(**options)
+    encoder = _encoder_for(options)
     return encoder.encode(obj)
 
 def loads(data: bytes) -> Any:
     """Deserialize BTOON bytes to object."""
-    decoder = EnhancedDecoder()
-    return decoder.decode(data)
+    return _get_decoder().decode(data)
 
 def dump(obj: Any, fp: BinaryIO, **options) -> None:
     """Serialize object to BTOON file."""
@@ -626,16 +983,12 @@ class SchemaBuilder:
 
 # ============= Export enhanced API =============
 
-# Override base module functions with enhanced versions
-_original_encode = encode
-_original_decode = decode
-
+# Enhanced encode/decode with Python types support
 def encode(obj: Any, **options) -> bytes:
     """Enhanced encode with Python types support."""
-    encoder = EnhancedEncoder(**options)
+    encoder = _encoder_for(options)
     return encoder.encode(obj)
 
 def decode(data: bytes) -> Any:
     """Enhanced decode with Python types support."""
-    decoder = EnhancedDecoder()
-    return decoder.decode(data)
+    return _get_decoder().decode(data)
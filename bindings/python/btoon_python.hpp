@@ -15,12 +15,210 @@
 #include "btoon/btoon.h"
 #include "btoon/schema.h"
 #include "btoon/validator.h"
+#include "btoon/zero_copy.h"
+#include <nlohmann/json.hpp>
+#include <charconv>
+#include <cmath>
+#include <cstring>
+#include <filesystem>
 #include <sstream>
 #include <optional>
+#include <unordered_map>
 
 namespace py = pybind11;
 namespace btoon_py {
 
+/// Extension type carrying a decimal.Decimal in binary form
+constexpr int8_t DECIMAL_EXT_TYPE = -7;
+
+enum : uint8_t {
+    DECIMAL_NEGATIVE = 0x01,
+    DECIMAL_NAN = 0x02,
+    DECIMAL_SNAN = 0x04,
+    DECIMAL_INFINITY = 0x08,
+};
+
+/**
+ * @brief Encode a decimal.Decimal as a DECIMAL_EXT_TYPE extension
+ * 
+ * Layout mirrors Decimal.as_tuple(): a flags byte (sign, NaN, sNaN,
+ * Infinity), then for finite values a big-endian int32 exponent and the
+ * coefficient as minimal big-endian unsigned bytes. No str() round-trip.
+ */
+inline btoon::Extension decimalToExtension(const py::handle& dec) {
+    py::tuple parts = dec.attr("as_tuple")();
+    btoon::Extension ext{DECIMAL_EXT_TYPE, {}};
+    uint8_t flags = parts[0].cast<int>() ? DECIMAL_NEGATIVE : 0;
+    
+    py::object exponent = parts[2];
+    if (py::isinstance<py::str>(exponent)) {
+        std::string kind = exponent.cast<std::string>();
+        flags |= kind == "n" ? DECIMAL_NAN : kind == "N" ? DECIMAL_SNAN : DECIMAL_INFINITY;
+        ext.data.push_back(flags);
+        return ext;
+    }
+    
+    int64_t exp = exponent.cast<int64_t>();
+    if (exp < INT32_MIN || exp > INT32_MAX) {
+        throw btoon::BtoonException("Decimal exponent out of range");
+    }
+    auto exp_bits = static_cast<uint32_t>(static_cast<int32_t>(exp));
+    ext.data = {flags,
+                static_cast<uint8_t>(exp_bits >> 24), static_cast<uint8_t>(exp_bits >> 16),
+                static_cast<uint8_t>(exp_bits >> 8), static_cast<uint8_t>(exp_bits)};
+    
+    py::tuple digits = parts[1];
+    if (digits.size() <= 19) {
+        // Fits in 64 bits: build the coefficient without Python ints
+        uint64_t coefficient = 0;
+        for (auto digit : digits) {
+            coefficient = coefficient * 10 + digit.cast<uint64_t>();
+        }
+        int nbytes = 0;
+        for (uint64_t c = coefficient; c != 0; c >>= 8) {
+            ++nbytes;
+        }
+        for (int i = nbytes - 1; i >= 0; --i) {
+            ext.data.push_back(static_cast<uint8_t>(coefficient >> (8 * i)));
+        }
+    } else {
+        std::string text;
+        text.reserve(digits.size());
+        for (auto digit : digits) {
+            text.push_back(static_cast<char>('0' + digit.cast<int>()));
+        }
+        auto coefficient = py::reinterpret_steal<py::object>(
+            PyLong_FromString(text.c_str(), nullptr, 10));
+        if (!coefficient) {
+            throw py::error_already_set();
+        }
+        size_t nbytes = (coefficient.attr("bit_length")().cast<size_t>() + 7) / 8;
+        std::string bytes = coefficient.attr("to_bytes")(nbytes, "big").cast<std::string>();
+        ext.data.insert(ext.data.end(), bytes.begin(), bytes.end());
+    }
+    return ext;
+}
+
+/**
+ * @brief Rebuild a decimal.Decimal from a DECIMAL_EXT_TYPE extension
+ */
+inline py::object extensionToDecimal(const btoon::Extension& ext) {
+    if (ext.data.empty()) {
+        throw btoon::BtoonException("Invalid decimal extension");
+    }
+    auto decimal = py::module_::import("decimal").attr("Decimal");
+    uint8_t flags = ext.data[0];
+    int sign = (flags & DECIMAL_NEGATIVE) ? 1 : 0;
+    
+    if (flags & (DECIMAL_NAN | DECIMAL_SNAN | DECIMAL_INFINITY)) {
+        const char* kind = (flags & DECIMAL_NAN) ? "n" : (flags & DECIMAL_SNAN) ? "N" : "F";
+        return decimal(py::make_tuple(sign, py::tuple(), kind));
+    }
+    if (ext.data.size() < 5) {
+        throw btoon::BtoonException("Invalid decimal extension");
+    }
+    
+    auto exp_bits = (static_cast<uint32_t>(ext.data[1]) << 24) |
+                    (static_cast<uint32_t>(ext.data[2]) << 16) |
+                    (static_cast<uint32_t>(ext.data[3]) << 8) |
+                    static_cast<uint32_t>(ext.data[4]);
+    const uint8_t* coefficient = ext.data.data() + 5;
+    size_t length = ext.data.size() - 5;
+    
+    std::string text;
+    if (length <= 8) {
+        uint64_t value = 0;
+        for (size_t i = 0; i < length; ++i) {
+            value = (value << 8) | coefficient[i];
+        }
+        text = std::to_string(value);
+    } else {
+        auto int_type = py::reinterpret_borrow<py::object>(
+            reinterpret_cast<PyObject*>(&PyLong_Type));
+        py::object value = int_type.attr("from_bytes")(
+            py::bytes(reinterpret_cast<const char*>(coefficient), length), "big");
+        text = py::str(value).cast<std::string>();
+    }
+    
+    py::tuple digits(text.size());
+    for (size_t i = 0; i < text.size(); ++i) {
+        digits[i] = py::int_(text[i] - '0');
+    }
+    return decimal(py::make_tuple(sign, digits, static_cast<int32_t>(exp_bits)));
+}
+
+/**
+ * @brief The bytes of a buffer-protocol object as one contiguous span
+ * 
+ * C-contiguous buffers are viewed in place; strided ones (e.g.
+ * memoryview(b)[::2]) are first gathered in C order into an owned copy,
+ * as bytes(view) would. Construct with the GIL held.
+ */
+class ContiguousBytes {
+public:
+    explicit ContiguousBytes(const py::buffer& data) : info_(data.request()) {
+        auto size = static_cast<size_t>(info_.size * info_.itemsize);
+        if (PyBuffer_IsContiguous(info_.view(), 'C')) {
+            span_ = {static_cast<const uint8_t*>(info_.ptr), size};
+            return;
+        }
+        copy_.resize(size);
+        if (PyBuffer_ToContiguous(copy_.data(), info_.view(),
+                                  static_cast<Py_ssize_t>(size), 'C') < 0) {
+            throw py::error_already_set();
+        }
+        span_ = copy_;
+    }
+    
+    std::span<const uint8_t> span() const { return span_; }
+    
+private:
+    py::buffer_info info_;
+    std::vector<uint8_t> copy_;
+    std::span<const uint8_t> span_;
+};
+
+/**
+ * @brief Schema-specialized encoding plan
+ * 
+ * Resolves each field's declared type to a fixed conversion once, at
+ * compile time, so encoding a record does a dict lookup and a direct
+ * cast per field instead of the generic isinstance chain.
+ */
+class PyCompiledSchema {
+public:
+    enum class Kind { String, Int, Uint, Float, Bool, Binary, Generic };
+    
+    struct Field {
+        std::string name;
+        py::str key;
+        Kind kind;
+    };
+    
+    explicit PyCompiledSchema(const btoon::Schema& schema) {
+        for (const auto& field : schema.getFields()) {
+            fields_.push_back({field.name, py::str(field.name), kindOf(field.type)});
+        }
+    }
+    
+    const std::vector<Field>& fields() const { return fields_; }
+    
+    size_t size() const { return fields_.size(); }
+    
+private:
+    std::vector<Field> fields_;
+    
+    static Kind kindOf(const std::string& type) {
+        if (type == "string") return Kind::String;
+        if (type == "int") return Kind::Int;
+        if (type == "uint") return Kind::Uint;
+        if (type == "float") return Kind::Float;
+        if (type == "bool") return Kind::Bool;
+        if (type == "binary") return Kind::Binary;
+        return Kind::Generic;
+    }
+};
+
 /**
  * @brief Python-friendly encoder class
  * 
@@ -30,8 +228,15 @@ class PyEncoder {
 public:
     PyEncoder(bool compress = false, 
               const std::string& algorithm = "auto",
-              int level = -1) {
+              int level = -1,
+              int workers = 0,
+              size_t frame_size = 0,
+              const py::bytes& dictionary = py::bytes()) {
         options_.compress = compress;
+        options_.compression_workers = workers;
+        options_.compression_frame_size = frame_size;
+        std::string_view dict = dictionary;
+        options_.compression_dictionary.assign(dict.begin(), dict.end());
         
         if (algorithm == "zlib") {
             options_.compression_algorithm = btoon::CompressionAlgorithm::ZLIB;
@@ -61,15 +266,179 @@ public:
      * - list/tuple -> Array
      * - dict -> Map
      * - datetime -> Timestamp extension
+     * - decimal.Decimal -> Decimal extension
      * - numpy arrays -> optimized encoding
      */
     py::bytes encode(const py::object& obj) {
-        btoon::Value value = pythonToValue(obj);
-        auto encoded = btoon::encode(value, options_);
+        return encode_value(pythonToValue(obj));
+    }
+    
+    /**
+     * @brief Encode an already-built btoon::Value with this encoder's options
+     */
+    py::bytes encode_value(const btoon::Value& value) {
+        std::vector<uint8_t> encoded;
+        {
+            // Value is fully built; encoding and compression need no GIL
+            py::gil_scoped_release release;
+            encoded = btoon::encode(value, options_);
+        }
         return py::bytes(reinterpret_cast<const char*>(encoded.data()), 
                         encoded.size());
     }
     
+    /**
+     * @brief Size in bytes of encode(obj), without creating a bytes object
+     */
+    size_t encoded_size(const py::object& obj) {
+        btoon::Value value = pythonToValue(obj);
+        py::gil_scoped_release release;
+        return btoon::encode(value, options_).size();
+    }
+    
+    /**
+     * @brief Encode into a caller-owned bytearray at `offset`
+     * 
+     * The bytearray is resized to offset + encoded size, so pooled
+     * buffers can be reused without allocating a bytes object per call.
+     * 
+     * @return Number of encoded bytes written
+     */
+    size_t encode_into(const py::object& obj, const py::bytearray& out, size_t offset = 0) {
+        btoon::Value value = pythonToValue(obj);
+        std::vector<uint8_t> encoded;
+        {
+            py::gil_scoped_release release;
+            encoded = btoon::encode(value, options_);
+        }
+        if (PyByteArray_Resize(out.ptr(), static_cast<Py_ssize_t>(offset + encoded.size())) < 0) {
+            throw py::error_already_set();
+        }
+        std::memcpy(PyByteArray_AS_STRING(out.ptr()) + offset, encoded.data(), encoded.size());
+        return encoded.size();
+    }
+    
+    /**
+     * @brief Encode a batch of Python objects in a single call
+     * 
+     * Amortizes the Python/C++ boundary crossing and option setup
+     * across the whole batch; returns one bytes object per input.
+     */
+    py::list encode_many(const py::iterable& objs) {
+        py::list result;
+        for (auto item : objs) {
+            result.append(encode(py::reinterpret_borrow<py::object>(item)));
+        }
+        return result;
+    }
+    
+    /**
+     * @brief Encode a batch as length-prefixed stream frames
+     * 
+     * Produces the `[u32 big-endian length][payload]` framing used by
+     * StreamEncoder for every object, so the per-record framing loop
+     * runs in C++ rather than in the Python wrapper.
+     */
+    py::bytes encode_framed(const py::iterable& objs) {
+        std::vector<uint8_t> out;
+        for (auto item : objs) {
+            btoon::Value value = pythonToValue(py::reinterpret_borrow<py::object>(item));
+            std::vector<uint8_t> encoded;
+            {
+                py::gil_scoped_release release;
+                encoded = btoon::encode(value, options_);
+            }
+            uint32_t length = static_cast<uint32_t>(encoded.size());
+            const uint8_t header[4] = {
+                static_cast<uint8_t>(length >> 24),
+                static_cast<uint8_t>(length >> 16),
+                static_cast<uint8_t>(length >> 8),
+                static_cast<uint8_t>(length)
+            };
+            out.insert(out.end(), header, header + 4);
+            out.insert(out.end(), encoded.begin(), encoded.end());
+        }
+        return py::bytes(reinterpret_cast<const char*>(out.data()), out.size());
+    }
+    
+    /**
+     * @brief Encode a batch as length-prefixed frames into a caller-owned bytearray
+     * 
+     * Same framing as encode_framed, but each frame is copied straight
+     * into `out` starting at `offset` (`out` is resized to end with the
+     * batch) so a stream writer can reuse one buffer for every batch
+     * instead of allocating a bytes object.
+     * 
+     * @return Number of bytes written
+     */
+    size_t encode_framed_into(const py::iterable& objs, const py::bytearray& out,
+                              size_t offset = 0) {
+        size_t size = offset;
+        for (auto item : objs) {
+            btoon::Value value = pythonToValue(py::reinterpret_borrow<py::object>(item));
+            std::vector<uint8_t> encoded;
+            {
+                py::gil_scoped_release release;
+                encoded = btoon::encode(value, options_);
+            }
+            size_t needed = size + 4 + encoded.size();
+            if (static_cast<size_t>(PyByteArray_GET_SIZE(out.ptr())) < needed &&
+                PyByteArray_Resize(out.ptr(), static_cast<Py_ssize_t>(needed)) < 0) {
+                throw py::error_already_set();
+            }
+            auto* dst = reinterpret_cast<uint8_t*>(PyByteArray_AS_STRING(out.ptr())) + size;
+            uint32_t length = static_cast<uint32_t>(encoded.size());
+            dst[0] = static_cast<uint8_t>(length >> 24);
+            dst[1] = static_cast<uint8_t>(length >> 16);
+            dst[2] = static_cast<uint8_t>(length >> 8);
+            dst[3] = static_cast<uint8_t>(length);
+            std::memcpy(dst + 4, encoded.data(), encoded.size());
+            size = needed;
+        }
+        if (PyByteArray_Resize(out.ptr(), static_cast<Py_ssize_t>(size)) < 0) {
+            throw py::error_already_set();
+        }
+        return size - offset;
+    }
+    
+    /**
+     * @brief Encode a record using a schema-specialized plan
+     * 
+     * Fields take the BTOON type their schema declares ("int" is always
+     * encoded as Int, "uint" as Uint). Values whose Python type does not
+     * match the declaration, non-schema keys, and non-dict input go
+     * through the generic conversion.
+     */
+    py::bytes encode_compiled(const py::object& obj, const PyCompiledSchema& compiled) {
+        if (!PyDict_Check(obj.ptr())) {
+            return encode(obj);
+        }
+        py::dict dict = py::reinterpret_borrow<py::dict>(obj);
+        btoon::Map map;
+        size_t matched = 0;
+        for (const auto& field : compiled.fields()) {
+            PyObject* item = PyDict_GetItemWithError(dict.ptr(), field.key.ptr());
+            if (item == nullptr) {
+                if (PyErr_Occurred()) {
+                    throw py::error_already_set();
+                }
+                continue;
+            }
+            ++matched;
+            map.emplace(field.name, compiledFieldValue(field.kind, item));
+        }
+        if (matched != static_cast<size_t>(PyDict_Size(dict.ptr()))) {
+            for (auto item : dict) {
+                auto key = item.first.cast<std::string>();
+                if (map.find(key) == map.end()) {
+                    map.emplace(std::move(key),
+                                pythonToValue(py::reinterpret_borrow<py::object>(item.second)));
+                }
+            }
+        }
+        return encode_value(map);
+    }
+    
     /**
      * @brief Encode with schema validation
      */
@@ -81,9 +450,7 @@ public:
             throw std::runtime_error("Value does not match schema");
         }
         
-        auto encoded = btoon::encode(value, options_);
-        return py::bytes(reinterpret_cast<const char*>(encoded.data()), 
-                        encoded.size());
+        return encode_value(value);
     }
     
     /**
@@ -117,14 +484,92 @@ public:
         options_.min_compression_size = size;
         return *this;
     }
-    
+
+    /**
+     * @brief Train a ZSTD dictionary from sample payloads
+     *
+     * The result can be passed as ``dictionary=`` to both Encoder and
+     * Decoder to improve the ratio on small, similar messages.
+     */
+    static py::bytes train_dictionary(const py::iterable& samples, size_t size) {
+#ifdef BTOON_WITH_ZSTD
+        std::vector<std::vector<uint8_t>> buffers;
+        for (auto item : samples) {
+            std::string_view sample = py::cast<py::bytes>(item);
+            buffers.emplace_back(sample.begin(), sample.end());
+        }
+        std::vector<uint8_t> dict;
+        {
+            py::gil_scoped_release release;
+            dict = btoon::train_zstd_dictionary(buffers, size);
+        }
+        return py::bytes(reinterpret_cast<const char*>(dict.data()), dict.size());
+#else
+        (void)samples;
+        (void)size;
+        throw btoon::BtoonException("ZSTD support not compiled in");
+#endif
+    }
+
     // Context manager support
     PyEncoder& __enter__() { return *this; }
     void __exit__(py::object, py::object, py::object) {}
     
+    /**
+     * @brief Convert a Python object to a btoon::Value without encoding
+     */
+    btoon::Value to_value(const py::object& obj) {
+        return pythonToValue(obj);
+    }
+    
 private:
     btoon::EncodeOptions options_;
     
+    btoon::Value compiledFieldValue(PyCompiledSchema::Kind kind, PyObject* item) {
+        using Kind = PyCompiledSchema::Kind;
+        switch (kind) {
+            case Kind::String:
+                if (PyUnicode_CheckExact(item)) {
+                    Py_ssize_t size;
+                    const char* data = PyUnicode_AsUTF8AndSize(item, &size);
+                    if (data == nullptr) {
+                        throw py::error_already_set();
+                    }
+                    return btoon::String(data, static_cast<size_t>(size));
+                }
+                break;
+            case Kind::Int:
+                if (PyLong_CheckExact(item)) {
+                    return btoon::Int(py::handle(item).cast<int64_t>());
+                }
+                break;
+            case Kind::Uint:
+                if (PyLong_CheckExact(item)) {
+                    return btoon::Uint(py::handle(item).cast<uint64_t>());
+                }
+                break;
+            case Kind::Float:
+                if (PyFloat_CheckExact(item)) {
+                    return btoon::Float(PyFloat_AS_DOUBLE(item));
+                }
+                break;
+            case Kind::Bool:
+                if (PyBool_Check(item)) {
+                    return btoon::Bool(item == Py_True);
+                }
+                break;
+            case Kind::Binary:
+                if (PyBytes_CheckExact(item)) {
+                    const auto* data = reinterpret_cast<const uint8_t*>(PyBytes_AS_STRING(item));
+                    return btoon::Binary(data, data + PyBytes_GET_SIZE(item));
+                }
+                break;
+            case Kind::Generic:
+                break;
+        }
+        return pythonToValue(py::reinterpret_borrow<py::object>(item));
+    }
+    
     btoon::Value pythonToValue(const py::object& obj) {
         if (obj.is_none()) {
             return btoon::Nil{};
@@ -144,6 +589,16 @@ private:
                   py::isinstance<py::bytearray>(obj)) {
             std::string bytes = obj.cast<std::string>();
             return btoon::Binary(bytes.begin(), bytes.end());
+        } else if (py::isinstance<py::memoryview>(obj)) {
+            // Copy straight out of the exporter's memory (e.g. a numpy array);
+            // strided views are gathered in C order, as bytes(view) would
+            py::buffer_info info = py::reinterpret_borrow<py::buffer>(obj).request();
+            btoon::Binary bin(static_cast<size_t>(info.size * info.itemsize));
+            if (PyBuffer_ToContiguous(bin.data(), info.view(),
+                                      static_cast<Py_ssize_t>(bin.size()), 'C') < 0) {
+                throw py::error_already_set();
+            }
+            return bin;
         } else if (py::isinstance<py::list>(obj) || 
                   py::isinstance<py::tuple>(obj)) {
             btoon::Array arr;
@@ -160,6 +615,14 @@ private:
             }
             return map;
         }
+        // decimal.Decimal -> binary decimal extension
+        else if (py::isinstance(obj, py::module_::import("decimal").attr("Decimal"))) {
+            return decimalToExtension(obj);
+        }
+        // Pre-built extension values (e.g. btoon_enhanced timestamps)
+        else if (py::isinstance<btoon::Extension>(obj)) {
+            return obj.cast<btoon::Extension>();
+        }
         // Handle numpy arrays if available
         else if (py::module_::import("numpy").attr("ndarray").ptr() &&
                 py::isinstance(obj, py::module_::import("numpy").attr("ndarray"))) {
@@ -168,9 +631,23 @@ private:
         // Handle datetime
         else if (py::module_::import("datetime").attr("datetime").ptr() &&
                 py::isinstance(obj, py::module_::import("datetime").attr("datetime"))) {
-            auto dt = obj;
-            auto timestamp = dt.attr("timestamp")().cast<double>();
-            return btoon::Timestamp{static_cast<int64_t>(timestamp)};
+            // Naive datetimes are taken as UTC, like btoon_enhanced does;
+            // dt.timestamp() would read them as local time
+            auto datetime = py::module_::import("datetime");
+            py::object offset = obj.attr("utcoffset")();
+            py::object epoch = offset.is_none()
+                ? datetime.attr("datetime")(1970, 1, 1)
+                : datetime.attr("datetime")(1970, 1, 1, py::arg("tzinfo") =
+                                            datetime.attr("timezone").attr("utc"));
+            py::object delta = obj - epoch;
+            auto seconds = delta.attr("days").cast<int64_t>() * 86400 +
+                           delta.attr("seconds").cast<int64_t>();
+            auto nanoseconds = delta.attr("microseconds").cast<uint32_t>() * 1000;
+            if (!offset.is_none()) {
+                auto minutes = offset.attr("total_seconds")().cast<double>() / 60;
+                return btoon::Timestamp{seconds, nanoseconds, static_cast<int16_t>(minutes)};
+            }
+            return btoon::Timestamp{seconds, nanoseconds};
         }
         
         throw std::runtime_error("Unsupported Python type for BTOON encoding");
@@ -194,10 +671,23 @@ class PyDecoder {
 public:
     PyDecoder(bool auto_decompress = true, 
               bool strict = false,
-              bool use_decimal = false) {
+              bool use_decimal = false,
+              const py::bytes& dictionary = py::bytes(),
+              const py::dict& markers = py::dict(),
+              const py::dict& ext_hooks = py::dict()) {
         options_.auto_decompress = auto_decompress;
         options_.strict = strict;
+        std::string_view dict = dictionary;
+        options_.compression_dictionary.assign(dict.begin(), dict.end());
         use_decimal_ = use_decimal;
+        for (auto item : markers) {
+            marker_hooks_.emplace(item.first.cast<std::string>(),
+                                  py::reinterpret_borrow<py::object>(item.second));
+        }
+        for (auto item : ext_hooks) {
+            ext_hooks_.emplace(item.first.cast<int8_t>(),
+                               py::reinterpret_borrow<py::object>(item.second));
+        }
     }
     
     /**
@@ -213,17 +703,83 @@ public:
      * - Array -> list
      * - Map -> dict
      * - Timestamp -> datetime
+     * - Decimal extension -> decimal.Decimal
+     * 
+     * Single-key maps whose key is a registered marker are replaced by that
+     * marker's hook applied to the decoded value, and extensions with a
+     * registered type id by their ext hook applied to the value above, so
+     * typed objects are built while the tree is constructed.
+     * 
+     * Accepts any object exposing the buffer protocol (bytes, bytearray,
+     * memoryview, mmap) and decodes it in place without copying.
      */
-    py::object decode(const py::bytes& data) {
-        std::string str_data = data;
-        std::vector<uint8_t> vec_data(str_data.begin(), str_data.end());
-        
-        btoon::Decoder decoder(options_);
-        btoon::Value value = decoder.decode(vec_data);
+    py::object decode(const py::buffer& data) {
+        ContiguousBytes bytes(data);
+        btoon::Value value;
+        {
+            // Pure C++ work; lets other Python threads decode concurrently
+            py::gil_scoped_release release;
+            value = btoon::decode(bytes.span(), options_);
+        }
         
         return valueToPython(value);
     }
     
+    /**
+     * @brief Decode a batch of BTOON payloads in a single call
+     */
+    py::list decode_many(const py::iterable& payloads) {
+        py::list result;
+        for (auto item : payloads) {
+            result.append(decode(py::reinterpret_borrow<py::buffer>(item)));
+        }
+        return result;
+    }
+    
+    /**
+     * @brief Decode a buffer of ``[u32 big-endian length][payload]`` frames
+     * 
+     * Payloads are decoded in place from ``data``; a truncated trailing
+     * frame raises instead of being silently dropped. Framing and parsing
+     * run without the GIL; only building the Python objects holds it.
+     */
+    py::list decode_frames(std::span<const uint8_t> data) {
+        std::vector<btoon::Value> values;
+        {
+            py::gil_scoped_release release;
+            
+            // First pass validates the framing and sizes the value vector
+            size_t count = 0;
+            for (size_t pos = 0; pos < data.size(); ++count) {
+                if (data.size() - pos < 4) {
+                    throw btoon::BtoonException("Truncated frame header at offset " +
+                                                std::to_string(pos));
+                }
+                size_t length = frameLength(data.data() + pos);
+                if (data.size() - pos - 4 < length) {
+                    throw btoon::BtoonException("Truncated frame payload at offset " +
+                                                std::to_string(pos));
+                }
+                pos += 4 + length;
+            }
+            
+            values.reserve(count);
+            for (size_t pos = 0; pos < data.size();) {
+                size_t length = frameLength(data.data() + pos);
+                values.push_back(btoon::decode(data.subspan(pos + 4, length), options_));
+                pos += 4 + length;
+            }
+        }
+        
+        py::list result(values.size());
+        for (size_t i = 0; i < values.size(); ++i) {
+            result[i] = valueToPython(values[i]);
+            // Release each tree once converted so peak memory stays near one copy
+            values[i] = btoon::Value();
+        }
+        return result;
+    }
+    
     /**
      * @brief Decode with schema validation
      */
@@ -232,8 +788,7 @@ public:
         std::string str_data = data;
         std::vector<uint8_t> vec_data(str_data.begin(), str_data.end());
         
-        btoon::Decoder decoder(options_);
-        btoon::Value value = decoder.decode(vec_data);
+        btoon::Value value = btoon::decode(vec_data, options_);
         
         if (!schema.validate(value)) {
             throw std::runtime_error("Decoded value does not match schema");
@@ -245,7 +800,7 @@ public:
     /**
      * @brief Decode and return as pandas DataFrame (if tabular)
      */
-    py::object decode_as_dataframe(const py::bytes& data) {
+    py::object decode_as_dataframe(const py::buffer& data) {
         auto obj = decode(data);
         
         // Check if it's tabular data
@@ -261,13 +816,51 @@ public:
         return obj;
     }
     
+    /**
+     * @brief Convert a btoon::Value to a Python object without decoding
+     */
+    py::object to_python(const btoon::Value& value) {
+        return valueToPython(value);
+    }
+    
     // Context manager support
     PyDecoder& __enter__() { return *this; }
     void __exit__(py::object, py::object, py::object) {}
     
+    /**
+     * @brief Memory-map ``path`` and decode every length-prefixed frame in it
+     */
+    py::list read_frames(const std::string& path) {
+        std::unique_ptr<btoon::MemoryMappedFile> file;
+        bool empty = false;
+        {
+            py::gil_scoped_release release;
+            file = btoon::MemoryMappedFile::open(path);
+            if (!file) {
+                // Zero-length files cannot be mapped but hold no frames
+                std::error_code ec;
+                empty = std::filesystem::file_size(path, ec) == 0 && !ec;
+            }
+        }
+        if (!file) {
+            if (empty) {
+                return py::list();
+            }
+            throw btoon::BtoonException("Cannot map file: " + path);
+        }
+        return decode_frames({file->data(), file->size()});
+    }
+    
 private:
     btoon::DecodeOptions options_;
     bool use_decimal_;
+    std::unordered_map<std::string, py::object> marker_hooks_;
+    std::unordered_map<int8_t, py::object> ext_hooks_;
+    
+    static size_t frameLength(const uint8_t* p) {
+        return (static_cast<size_t>(p[0]) << 24) | (static_cast<size_t>(p[1]) << 16) |
+               (static_cast<size_t>(p[2]) << 8) | static_cast<size_t>(p[3]);
+    }
     
     py::object valueToPython(const btoon::Value& value) {
         return std::visit([this](auto&& arg) -> py::object {
@@ -298,6 +891,12 @@ private:
                 }
                 return result;
             } else if constexpr (std::is_same_v<T, btoon::Map>) {
+                if (arg.size() == 1 && !marker_hooks_.empty()) {
+                    auto hook = marker_hooks_.find(arg.begin()->first);
+                    if (hook != marker_hooks_.end()) {
+                        return hook->second(valueToPython(arg.begin()->second));
+                    }
+                }
                 py::dict result;
                 for (const auto& [key, val] : arg) {
                     result[py::str(key)] = valueToPython(val);
@@ -305,12 +904,35 @@ private:
                 return result;
             } else if constexpr (std::is_same_v<T, btoon::Timestamp>) {
                 auto dt = py::module_::import("datetime");
-                return dt.attr("datetime").attr("fromtimestamp")(arg.seconds);
+                py::object result;
+                if (arg.has_timezone) {
+                    auto offset = dt.attr("timedelta")(py::arg("minutes") = arg.timezone_offset);
+                    result = dt.attr("datetime").attr("fromtimestamp")(
+                        arg.seconds, dt.attr("timezone")(offset));
+                } else {
+                    // No offset: UTC, returned naive (fromtimestamp would
+                    // give local time)
+                    result = dt.attr("datetime")(1970, 1, 1) +
+                             dt.attr("timedelta")(py::arg("seconds") = arg.seconds);
+                }
+                return result.attr("replace")(py::arg("microsecond") = arg.nanoseconds / 1000);
             } else if constexpr (std::is_same_v<T, btoon::Extension>) {
-                // Return as tuple (type, data) for unknown extensions
-                return py::make_tuple(arg.type, 
-                                     py::bytes(reinterpret_cast<const char*>(arg.data.data()), 
-                                              arg.data.size()));
+                py::object result;
+                if (arg.type == DECIMAL_EXT_TYPE) {
+                    result = extensionToDecimal(arg);
+                } else {
+                    // Return as tuple (type, data) for unknown extensions
+                    result = py::make_tuple(arg.type, 
+                                           py::bytes(reinterpret_cast<const char*>(arg.data.data()), 
+                                                    arg.data.size()));
+                }
+                if (!ext_hooks_.empty()) {
+                    auto hook = ext_hooks_.find(arg.type);
+                    if (hook != ext_hooks_.end()) {
+                        return hook->second(result);
+                    }
+                }
+                return result;
             } else {
                 return py::none();
             }
@@ -323,28 +945,541 @@ private:
  */
 inline py::bytes dumps(const py::object& obj, 
                       bool compress = false,
-                      const std::string& compression = "auto") {
-    PyEncoder encoder(compress, compression);
+                      const std::string& compression = "auto",
+                      int workers = 0,
+                      size_t frame_size = 0) {
+    PyEncoder encoder(compress, compression, -1, workers, frame_size);
     return encoder.encode(obj);
 }
 
-inline py::object loads(const py::bytes& data, 
+inline py::object loads(const py::buffer& data, 
                         bool strict = false) {
     PyDecoder decoder(true, strict);
     return decoder.decode(data);
 }
 
+inline py::list dumps_many(const py::iterable& objs,
+                           bool compress = false,
+                           const std::string& compression = "auto") {
+    PyEncoder encoder(compress, compression);
+    return encoder.encode_many(objs);
+}
+
+inline py::list loads_many(const py::iterable& payloads,
+                           bool strict = false) {
+    PyDecoder decoder(true, strict);
+    return decoder.decode_many(payloads);
+}
+
+/**
+ * @brief Memory-map a length-prefixed frame file and decode every frame
+ * 
+ * Reads the layout written by ``open_btoon(..., streaming=True)`` and
+ * ``Encoder.encode_framed`` without per-frame reads or bytes objects.
+ */
+inline py::list read_all_frames(const std::string& path, bool strict = false) {
+    PyDecoder decoder(true, strict);
+    return decoder.read_frames(path);
+}
+
+/**
+ * @brief Validate many records against one schema in a single call
+ * 
+ * @return One bool per record
+ */
+inline py::list validate_batch(const btoon::Schema& schema,
+                               const py::iterable& records) {
+    PyEncoder converter;
+    py::list results;
+    for (auto item : records) {
+        auto value = converter.to_value(py::reinterpret_borrow<py::object>(item));
+        results.append(schema.validate(value));
+    }
+    return results;
+}
+
+namespace detail {
+
+inline void appendJsonEscape(std::string& out, uint32_t unit) {
+    static const char hex[] = "0123456789abcdef";
+    out += "\\u";
+    out += hex[(unit >> 12) & 0xF];
+    out += hex[(unit >> 8) & 0xF];
+    out += hex[(unit >> 4) & 0xF];
+    out += hex[unit & 0xF];
+}
+
+/**
+ * @brief Append a JSON string literal the way json.dumps(ensure_ascii=True) does
+ * 
+ * @return false if the text is not valid UTF-8
+ */
+inline bool appendJsonString(std::string& out, const std::string& str) {
+    out += '"';
+    const auto* p = reinterpret_cast<const unsigned char*>(str.data());
+    const auto* end = p + str.size();
+    while (p < end) {
+        unsigned char c = *p;
+        if (c < 0x80) {
+            ++p;
+            switch (c) {
+                case '"':  out += "\\\""; break;
+                case '\\': out += "\\\\"; break;
+                case '\n': out += "\\n"; break;
+                case '\r': out += "\\r"; break;
+                case '\t': out += "\\t"; break;
+                case '\b': out += "\\b"; break;
+                case '\f': out += "\\f"; break;
+                default:
+                    if (c < 0x20 || c == 0x7F) {
+                        appendJsonEscape(out, c);
+                    } else {
+                        out += static_cast<char>(c);
+                    }
+            }
+            continue;
+        }
+        // Decode one multi-byte UTF-8 sequence, rejecting overlong forms,
+        // surrogates and code points past U+10FFFF like Python's decoder
+        size_t len;
+        uint32_t cp;
+        uint32_t min;
+        if ((c & 0xE0) == 0xC0) { len = 2; cp = c & 0x1F; min = 0x80; }
+        else if ((c & 0xF0) == 0xE0) { len = 3; cp = c & 0x0F; min = 0x800; }
+        else if ((c & 0xF8) == 0xF0) { len = 4; cp = c & 0x07; min = 0x10000; }
+        else return false;
+        if (static_cast<size_t>(end - p) < len) return false;
+        for (size_t i = 1; i < len; ++i) {
+            if ((p[i] & 0xC0) != 0x80) return false;
+            cp = (cp << 6) | (p[i] & 0x3F);
+        }
+        if (cp < min || cp > 0x10FFFF || (cp >= 0xD800 && cp <= 0xDFFF)) return false;
+        p += len;
+        if (cp >= 0x10000) {
+            cp -= 0x10000;
+            appendJsonEscape(out, 0xD800 | (cp >> 10));
+            appendJsonEscape(out, 0xDC00 | (cp & 0x3FF));
+        } else {
+            appendJsonEscape(out, cp);
+        }
+    }
+    out += '"';
+    return true;
+}
+
+/**
+ * @brief Append a float spelled like Python's repr() (and so json.dumps)
+ * 
+ * Shortest round-trip digits; scientific notation when the decimal
+ * exponent is below -4 or 16 and above, fixed notation with at least one
+ * fractional digit otherwise. Non-finite values use json.dumps' NaN and
+ * Infinity spellings.
+ */
+inline void appendJsonFloat(std::string& out, double d) {
+    if (std::isnan(d)) {
+        out += "NaN";
+        return;
+    }
+    if (std::isinf(d)) {
+        out += d < 0 ? "-Infinity" : "Infinity";
+        return;
+    }
+    char buf[64];
+    auto sci = std::to_chars(buf, buf + sizeof(buf), d, std::chars_format::scientific);
+    std::string_view text(buf, sci.ptr - buf);
+    // Exponent as written by to_chars: e[+-]dd...; from_chars takes no '+'
+    size_t e = text.find('e');
+    int exponent = 0;
+    std::from_chars(text.data() + e + (text[e + 1] == '+' ? 2 : 1),
+                    text.data() + text.size(), exponent);
+    if (d != 0 && (exponent < -4 || exponent >= 16)) {
+        // to_chars already writes Python's form, e.g. 1e-05 and 1.5e+16
+        out += text;
+        return;
+    }
+    auto fixed = std::to_chars(buf, buf + sizeof(buf), d, std::chars_format::fixed);
+    text = std::string_view(buf, fixed.ptr - buf);
+    out += text;
+    if (text.find('.') == std::string_view::npos) {
+        out += ".0";
+    }
+}
+
+/**
+ * @brief Append the JSON text of a value exactly as json.dumps() renders it
+ * 
+ * @return false if json.dumps would render the decoded value differently
+ *         or reject it (binary, extensions, invalid UTF-8, ...)
+ */
+inline bool appendJson(std::string& out, const btoon::Value& value) {
+    return std::visit([&out](auto&& arg) -> bool {
+        using T = std::decay_t<decltype(arg)>;
+        if constexpr (std::is_same_v<T, btoon::Nil>) {
+            out += "null";
+        } else if constexpr (std::is_same_v<T, btoon::Bool>) {
+            out += arg ? "true" : "false";
+        } else if constexpr (std::is_same_v<T, btoon::Int> ||
+                             std::is_same_v<T, btoon::Uint>) {
+            out += std::to_string(arg);
+        } else if constexpr (std::is_same_v<T, btoon::Float>) {
+            appendJsonFloat(out, arg);
+        } else if constexpr (std::is_same_v<T, btoon::String>) {
+            return appendJsonString(out, arg);
+        } else if constexpr (std::is_same_v<T, btoon::Array>) {
+            out += '[';
+            for (size_t i = 0; i < arg.size(); ++i) {
+                if (i) out += ", ";
+                if (!appendJson(out, arg[i])) return false;
+            }
+            out += ']';
+        } else if constexpr (std::is_same_v<T, btoon::Map>) {
+            out += '{';
+            bool first = true;
+            for (const auto& [key, item] : arg) {
+                if (!first) out += ", ";
+                first = false;
+                if (!appendJsonString(out, key)) return false;
+                out += ": ";
+                if (!appendJson(out, item)) return false;
+            }
+            out += '}';
+        } else {
+            return false;
+        }
+        return true;
+    }, value);
+}
+
+/**
+ * @brief nlohmann::json SAX handler that builds a btoon::Value directly
+ * 
+ * Avoids materializing a nlohmann::json DOM (or Python objects) between
+ * the JSON text and the BTOON encoder.
+ */
+class ValueSax : public nlohmann::json_sax<nlohmann::json> {
+public:
+    btoon::Value result;
+    
+    bool null() override { return put(btoon::Nil{}); }
+    bool boolean(bool val) override { return put(btoon::Bool(val)); }
+    bool number_integer(number_integer_t val) override {
+        // Matches pythonToValue: non-negative ints are stored unsigned
+        if (val >= 0) {
+            return put(btoon::Uint(static_cast<uint64_t>(val)));
+        }
+        return put(btoon::Int(val));
+    }
+    bool number_unsigned(number_unsigned_t val) override { return put(btoon::Uint(val)); }
+    bool number_float(number_float_t val, const string_t& text) override {
+        // Integer literals wider than 64 bits arrive here as doubles;
+        // json.loads keeps them exact, so refuse rather than round
+        if (text.find_first_of(".eE") == string_t::npos) {
+            return false;
+        }
+        return put(btoon::Float(val));
+    }
+    bool string(string_t& val) override { return put(btoon::String(std::move(val))); }
+    bool binary(binary_t& val) override { return put(btoon::Binary(val.begin(), val.end())); }
+    
+    bool start_object(std::size_t) override {
+        stack_.push_back(put_container(btoon::Map{}));
+        return true;
+    }
+    bool key(string_t& val) override {
+        key_ = std::move(val);
+        return true;
+    }
+    bool end_object() override {
+        stack_.pop_back();
+        return true;
+    }
+    bool start_array(std::size_t) override {
+        stack_.push_back(put_container(btoon::Array{}));
+        return true;
+    }
+    bool end_array() override {
+        stack_.pop_back();
+        return true;
+    }
+    
+    bool parse_error(std::size_t, const std::string&,
+                     const nlohmann::detail::exception&) override {
+        return false;
+    }
+    
+private:
+    std::vector<btoon::Value*> stack_;
+    std::string key_;
+    
+    btoon::Value* put_container(btoon::Value&& value) {
+        if (stack_.empty()) {
+            result = std::move(value);
+            return &result;
+        }
+        btoon::Value* parent = stack_.back();
+        if (auto* arr = std::get_if<btoon::Array>(parent)) {
+            arr->push_back(std::move(value));
+            return &arr->back();
+        }
+        auto& map = std::get<btoon::Map>(*parent);
+        auto& slot = map[key_];
+        slot = std::move(value);
+        return &slot;
+    }
+    
+    bool put(btoon::Value&& value) {
+        put_container(std::move(value));
+        return true;
+    }
+};
+
+} // namespace detail
+
+/**
+ * @brief Transcode a BTOON payload straight to JSON text
+ * 
+ * Walks the decoded tree in C++ and writes the same ASCII text as
+ * json.dumps() with default arguments, without building Python objects.
+ * 
+ * @return JSON bytes, or None when the payload holds values json.dumps
+ *         renders differently or rejects; callers fall back to it then
+ */
+inline py::object transcode_to_json(const py::buffer& data, bool strict = false) {
+    ContiguousBytes bytes(data);
+    btoon::DecodeOptions options;
+    options.strict = strict;
+    std::string out;
+    bool ok;
+    {
+        py::gil_scoped_release release;
+        auto value = btoon::decode(bytes.span(), options);
+        ok = detail::appendJson(out, value);
+    }
+    if (!ok) {
+        return py::none();
+    }
+    return py::bytes(out);
+}
+
+/**
+ * @brief Transcode JSON text straight to a BTOON payload
+ * 
+ * Parses with a SAX handler that feeds btoon::Value construction
+ * directly, so no Python dict/list intermediates are created.
+ * 
+ * @return BTOON bytes, or None for text the strict parser does not take
+ *         but json.loads may (NaN/Infinity, integers wider than 64 bits,
+ *         lone surrogates); callers fall back to json.loads then
+ */
+inline py::object transcode_from_json(const std::string& json_text,
+                                      bool compress = false,
+                                      const std::string& compression = "auto") {
+    detail::ValueSax handler;
+    bool ok;
+    {
+        py::gil_scoped_release release;
+        ok = nlohmann::json::sax_parse(json_text, &handler);
+    }
+    if (!ok) {
+        return py::none();
+    }
+    PyEncoder encoder(compress, compression);
+    return encoder.encode_value(handler.result);
+}
+
+/**
+ * @brief Native tree walk behind EnhancedEncoder._convert_python_types
+ * 
+ * Exact dicts, lists and tuples are rebuilt in C++ and leaf scalars are
+ * passed through. Any other object is resolved through `dispatch`
+ * (exact type -> handler), falling back to `resolve(obj)` for
+ * subclasses; the handler is called as handler(encoder, obj). The
+ * `mapping`/`sequence` markers a handler lookup may return make the walk
+ * descend into container subclasses instead. A list of two or more items
+ * whose first item's exact type is a key of `lists` is first offered
+ * whole to lists[type](encoder, list); a None result walks it as usual.
+ */
+class TypeConverter {
+public:
+    TypeConverter(py::object encoder, py::dict dispatch, py::object resolve,
+                  py::object mapping, py::object sequence, py::dict lists = py::dict())
+        : encoder_(std::move(encoder)), dispatch_(std::move(dispatch)),
+          resolve_(std::move(resolve)), mapping_(std::move(mapping)),
+          sequence_(std::move(sequence)), lists_(std::move(lists)) {}
+    
+    py::object convert(py::handle obj) {
+        PyObject* o = obj.ptr();
+        if (o == Py_None || PyBool_Check(o) || PyLong_CheckExact(o) ||
+            PyFloat_CheckExact(o) || PyUnicode_CheckExact(o) || PyBytes_CheckExact(o)) {
+            return py::reinterpret_borrow<py::object>(obj);
+        }
+        
+        if (Py_EnterRecursiveCall(" while converting Python types")) {
+            throw py::error_already_set();
+        }
+        struct LeaveRecursiveCall {
+            ~LeaveRecursiveCall() { Py_LeaveRecursiveCall(); }
+        } leave;
+        
+        if (PyDict_CheckExact(o)) {
+            py::dict out;
+            PyObject* key;
+            PyObject* value;
+            Py_ssize_t pos = 0;
+            while (PyDict_Next(o, &pos, &key, &value)) {
+                py::object converted = convert(value);
+                if (PyDict_SetItem(out.ptr(), key, converted.ptr()) < 0) {
+                    throw py::error_already_set();
+                }
+            }
+            return std::move(out);
+        }
+        
+        if (PyList_CheckExact(o) && PyList_GET_SIZE(o) > 1 && PyDict_GET_SIZE(lists_.ptr()) > 0) {
+            PyObject* handler = PyDict_GetItemWithError(
+                lists_.ptr(), reinterpret_cast<PyObject*>(Py_TYPE(PyList_GET_ITEM(o, 0))));
+            if (handler != nullptr) {
+                py::object out = py::reinterpret_borrow<py::object>(handler)(encoder_, obj);
+                if (!out.is_none()) {
+                    return out;
+                }
+            } else if (PyErr_Occurred()) {
+                throw py::error_already_set();
+            }
+        }
+        
+        if (PyList_CheckExact(o) || PyTuple_CheckExact(o)) {
+            Py_ssize_t size = PySequence_Fast_GET_SIZE(o);
+            py::object out = py::reinterpret_steal<py::object>(PyList_New(size));
+            if (!out) {
+                throw py::error_already_set();
+            }
+            for (Py_ssize_t i = 0; i < size; ++i) {
+                if (i >= PySequence_Fast_GET_SIZE(o)) {
+                    throw py::value_error("sequence changed size during conversion");
+                }
+                py::object converted = convert(PySequence_Fast_GET_ITEM(o, i));
+                PyList_SET_ITEM(out.ptr(), i, converted.release().ptr());
+            }
+            return out;
+        }
+        
+        py::object handler;
+        PyObject* found = PyDict_GetItemWithError(dispatch_.ptr(),
+                                                  reinterpret_cast<PyObject*>(Py_TYPE(o)));
+        if (found != nullptr) {
+            handler = py::reinterpret_borrow<py::object>(found);
+        } else if (PyErr_Occurred()) {
+            throw py::error_already_set();
+        } else {
+            handler = resolve_(obj);
+        }
+        
+        if (handler.is_none()) {
+            return py::reinterpret_borrow<py::object>(obj);
+        }
+        if (handler.is(mapping_)) {
+            py::dict out;
+            for (auto item : obj.attr("items")()) {
+                auto pair = py::reinterpret_borrow<py::tuple>(item);
+                out[pair[0]] = convert(pair[1]);
+            }
+            return std::move(out);
+        }
+        if (handler.is(sequence_)) {
+            py::list out;
+            for (auto item : obj) {
+                out.append(convert(item));
+            }
+            return std::move(out);
+        }
+        return handler(encoder_, obj);
+    }
+    
+private:
+    py::object encoder_;
+    py::dict dispatch_;
+    py::object resolve_;
+    py::object mapping_;
+    py::object sequence_;
+    py::dict lists_;
+};
+
+/**
+ * @brief Native tree walk behind EnhancedDecoder._convert_to_python_types
+ * 
+ * Rebuilds decoded dicts and lists; a dict containing one of the keys in
+ * `markers` (checked in order) is replaced by marker_handler(decoder, dict).
+ * Any other value whose exact type is a key of `leaves` is replaced by
+ * leaves[type](value).
+ */
+inline py::object convert_decoded(py::handle obj, const py::object& decoder,
+                                  const py::dict& markers, const py::dict& leaves) {
+    PyObject* o = obj.ptr();
+    if (!PyDict_Check(o) && !PyList_Check(o)) {
+        PyObject* handler = PyDict_GetItemWithError(leaves.ptr(),
+                                                    reinterpret_cast<PyObject*>(Py_TYPE(o)));
+        if (handler != nullptr) {
+            return py::reinterpret_borrow<py::object>(handler)(obj);
+        }
+        if (PyErr_Occurred()) {
+            throw py::error_already_set();
+        }
+        return py::reinterpret_borrow<py::object>(obj);
+    }
+    
+    if (Py_EnterRecursiveCall(" while converting decoded types")) {
+        throw py::error_already_set();
+    }
+    struct LeaveRecursiveCall {
+        ~LeaveRecursiveCall() { Py_LeaveRecursiveCall(); }
+    } leave;
+    
+    if (PyList_Check(o)) {
+        Py_ssize_t size = PyList_GET_SIZE(o);
+        py::object out = py::reinterpret_steal<py::object>(PyList_New(size));
+        if (!out) {
+            throw py::error_already_set();
+        }
+        for (Py_ssize_t i = 0; i < size; ++i) {
+            py::object converted = convert_decoded(PyList_GET_ITEM(o, i), decoder, markers, leaves);
+            PyList_SET_ITEM(out.ptr(), i, converted.release().ptr());
+        }
+        return out;
+    }
+    
+    for (auto marker : markers) {
+        int has = PyDict_Contains(o, marker.first.ptr());
+        if (has < 0) {
+            throw py::error_already_set();
+        }
+        if (has) {
+            return py::reinterpret_borrow<py::object>(marker.second)(decoder, obj);
+        }
+    }
+    
+    py::dict out;
+    PyObject* key;
+    PyObject* value;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(o, &pos, &key, &value)) {
+        py::object converted = convert_decoded(value, decoder, markers, leaves);
+        if (PyDict_SetItem(out.ptr(), key, converted.ptr()) < 0) {
+            throw py::error_already_set();
+        }
+    }
+    return std::move(out);
+}
+
 /**
  * @brief Schema builder with fluent interface
  */
 class PySchemaBuilder {
 public:
-    PySchemaBuilder(const std::string& name) {
-        builder_.name(name);
-    }
+    PySchemaBuilder(const std::string& name) : builder_(name) {}
     
     PySchemaBuilder& version(const std::string& version) {
-        builder_.version(version);
+        builder_.version(btoon::SchemaVersion::fromString(version));
         return *this;
     }
     
@@ -357,22 +1492,48 @@ public:
                            const std::string& type,
                            bool required = true,
                            py::object default_val = py::none()) {
-        builder_.field(name, type, required);
-        // Handle default value if provided
+        btoon::SchemaField field{name, type, required};
+        if (!default_val.is_none()) {
+            field.default_value = PyEncoder().to_value(default_val);
+        }
+        builder_.field(field);
+        return *this;
+    }
+    
+    /**
+     * @brief Add many fields in one call
+     * 
+     * Takes the same dicts as create_schema: 'name', 'type', an
+     * optional 'required' (default true) and an optional 'default'.
+     */
+    PySchemaBuilder& add_fields_bulk(const py::iterable& fields) {
+        for (auto item : fields) {
+            if (!py::isinstance<py::dict>(item)) {
+                throw py::type_error("schema fields must be dicts, not " +
+                                     py::str(py::type::of(item).attr("__name__")).cast<std::string>());
+            }
+            auto field = py::reinterpret_borrow<py::dict>(item);
+            bool required = field.contains("required")
+                ? field["required"].cast<bool>() : true;
+            py::object default_val = field.contains("default")
+                ? py::object(field["default"]) : py::none();
+            this->field(field["name"].cast<std::string>(),
+                        field["type"].cast<std::string>(),
+                        required, default_val);
+        }
         return *this;
     }
     
     PySchemaBuilder& required_field(const std::string& name, 
                                     const std::string& type) {
-        builder_.field(name, type, true);
+        builder_.field(name, type);
         return *this;
     }
     
     PySchemaBuilder& optional_field(const std::string& name, 
                                     const std::string& type,
                                     py::object default_val = py::none()) {
-        builder_.field(name, type, false);
-        return *this;
+        return field(name, type, false, default_val);
     }
     
     std::shared_ptr<btoon::Schema> build() {
@@ -409,7 +1570,7 @@ public:
         std::vector<uint8_t> vec_data(str_data.begin(), str_data.end());
         
         btoon::Validator validator(options_);
-        auto result = validator.validate(vec_data);
+        auto result = validator.validate(std::span<const uint8_t>(vec_data));
         
         py::dict ret;
         ret["valid"] = result.valid;
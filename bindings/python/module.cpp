@@ -10,7 +10,7 @@
 namespace py = pybind11;
 using namespace btoon_py;
 
-PYBIND11_MODULE(btoon, m) {
+PYBIND11_MODULE(_btoon_native, m) {
     m.doc() = R"pbdoc(
         BTOON - Binary Tree Object Notation
         ====================================
@@ -36,6 +36,8 @@ PYBIND11_MODULE(btoon, m) {
           py::arg("obj"),
           py::arg("compress") = false,
           py::arg("compression") = "auto",
+          py::arg("workers") = 0,
+          py::arg("frame_size") = 0,
           R"pbdoc(
           Serialize object to BTOON bytes.
 
@@ -43,6 +45,9 @@ PYBIND11_MODULE(btoon, m) {
               obj: Python object to serialize
               compress: Enable compression (default: False)
               compression: Algorithm ('zlib', 'lz4', 'zstd', 'auto')
+              workers: ZSTD compression threads (0: none, -1: auto for >1 MiB)
+              frame_size: Split ZSTD output into independent frames of this
+                  many input bytes for parallel decompression (0: one frame)
 
           Returns:
               bytes: BTOON encoded data
@@ -70,16 +75,144 @@ PYBIND11_MODULE(btoon, m) {
               {'key': 'value'}
           )pbdoc");
 
+    m.def("dumps_many", &dumps_many,
+          py::arg("objs"),
+          py::arg("compress") = false,
+          py::arg("compression") = "auto",
+          R"pbdoc(
+          Serialize a batch of objects to BTOON in one call.
+
+          Args:
+              objs: Iterable of Python objects to serialize
+              compress: Enable compression (default: False)
+              compression: Algorithm ('zlib', 'lz4', 'zstd', 'auto')
+
+          Returns:
+              list[bytes]: One BTOON payload per input object
+          )pbdoc");
+
+    m.def("loads_many", &loads_many,
+          py::arg("payloads"),
+          py::arg("strict") = false,
+          R"pbdoc(
+          Deserialize a batch of BTOON payloads in one call.
+
+          Args:
+              payloads: Iterable of BTOON bytes objects
+              strict: Enable strict validation
+
+          Returns:
+              list: One decoded Python object per payload
+          )pbdoc");
+
+    m.def("read_all_frames", &read_all_frames,
+          py::arg("path"),
+          py::arg("strict") = false,
+          R"pbdoc(
+          Decode every length-prefixed frame in a file via a memory map.
+
+          Args:
+              path: File of [u32 big-endian length][payload] records
+              strict: Enable strict validation
+
+          Returns:
+              list: One decoded Python object per frame
+          )pbdoc");
+
+    m.def("transcode_to_json", &transcode_to_json,
+          py::arg("data"),
+          py::arg("strict") = false,
+          R"pbdoc(
+          Convert a BTOON payload to UTF-8 JSON bytes without creating Python objects.
+
+          Args:
+              data: BTOON bytes or any buffer-protocol object
+              strict: Enable strict validation
+
+          Returns:
+              bytes or None: JSON text identical to json.dumps() with default
+              arguments, or None if the payload holds values json.dumps
+              renders differently or rejects (binary, extensions, ...)
+          )pbdoc");
+
+    m.def("transcode_from_json", &transcode_from_json,
+          py::arg("json"),
+          py::arg("compress") = false,
+          py::arg("compression") = "auto",
+          R"pbdoc(
+          Convert JSON text to a BTOON payload without creating Python objects.
+
+          Args:
+              json: JSON str or UTF-8 bytes
+              compress: Enable compression (default: False)
+              compression: Algorithm ('zlib', 'lz4', 'zstd', 'auto')
+
+          Returns:
+              bytes or None: BTOON-encoded data, or None for JSON the strict
+              native parser does not accept (NaN/Infinity literals, integers
+              wider than 64 bits, ...)
+          )pbdoc");
+
+    m.def("_convert_encode",
+          [](py::handle obj, py::object encoder, py::dict dispatch,
+             py::object resolve, py::object mapping, py::object sequence,
+             py::dict lists) {
+              return TypeConverter(std::move(encoder), std::move(dispatch),
+                                   std::move(resolve), std::move(mapping),
+                                   std::move(sequence), std::move(lists)).convert(obj);
+          },
+          py::arg("obj"),
+          py::arg("encoder"),
+          py::arg("dispatch"),
+          py::arg("resolve"),
+          py::arg("mapping"),
+          py::arg("sequence"),
+          py::arg("lists") = py::dict(),
+          "Native tree walk used by btoon_enhanced.EnhancedEncoder");
+
+    m.def("_convert_decode", &convert_decoded,
+          py::arg("obj"),
+          py::arg("decoder"),
+          py::arg("markers"),
+          py::arg("leaves"),
+          "Native tree walk used by btoon_enhanced.EnhancedDecoder");
+
     // Encoder class
     py::class_<PyEncoder>(m, "Encoder")
-        .def(py::init<bool, const std::string&, int>(),
+        .def(py::init<bool, const std::string&, int, int, size_t, const py::bytes&>(),
              py::arg("compress") = false,
              py::arg("algorithm") = "auto",
              py::arg("level") = -1,
+             py::arg("workers") = 0,
+             py::arg("frame_size") = 0,
+             py::arg("dictionary") = py::bytes(),
              "Create an encoder with options")
         .def("encode", &PyEncoder::encode,
              py::arg("obj"),
              "Encode Python object to BTOON")
+        .def("encoded_size", &PyEncoder::encoded_size,
+             py::arg("obj"),
+             "Size in bytes of encode(obj), without creating a bytes object")
+        .def("encode_into", &PyEncoder::encode_into,
+             py::arg("obj"),
+             py::arg("out"),
+             py::arg("offset") = 0,
+             "Encode into a bytearray at offset (resizing it), returning the encoded size")
+        .def("encode_many", &PyEncoder::encode_many,
+             py::arg("objs"),
+             "Encode an iterable of Python objects, returning a list of bytes")
+        .def("encode_framed", &PyEncoder::encode_framed,
+             py::arg("objs"),
+             "Encode an iterable as length-prefixed stream frames in one buffer")
+        .def("encode_framed_into", &PyEncoder::encode_framed_into,
+             py::arg("objs"),
+             py::arg("out"),
+             py::arg("offset") = 0,
+             "Encode an iterable as length-prefixed stream frames into a bytearray")
+        .def("encode_compiled", &PyEncoder::encode_compiled,
+             py::arg("obj"),
+             py::arg("compiled"),
+             "Encode a record using a plan from Schema.compile_encoder()")
         .def("encode_with_schema", &PyEncoder::encode_with_schema,
              py::arg("obj"),
              py::arg("schema"),
@@ -93,20 +226,32 @@ PYBIND11_MODULE(btoon, m) {
              py::arg("size"),
              py::return_value_policy::reference_internal,
              "Set minimum size for compression")
+        .def_static("train_dictionary", &PyEncoder::train_dictionary,
+                    py::arg("samples"),
+                    py::arg("size") = 112640,
+                    "Train a ZSTD dictionary (bytes) from an iterable of sample payloads")
         .def("__enter__", &PyEncoder::__enter__,
              py::return_value_policy::reference_internal)
         .def("__exit__", &PyEncoder::__exit__);
 
     // Decoder class
     py::class_<PyDecoder>(m, "Decoder")
-        .def(py::init<bool, bool, bool>(),
+        .def(py::init<bool, bool, bool, const py::bytes&, const py::dict&, const py::dict&>(),
              py::arg("auto_decompress") = true,
              py::arg("strict") = false,
              py::arg("use_decimal") = false,
-             "Create a decoder with options")
+             py::arg("dictionary") = py::bytes(),
+             py::arg("markers") = py::dict(),
+             py::arg("ext_hooks") = py::dict(),
+             "Create a decoder with options; ``markers`` and ``ext_hooks`` map "
+             "single-key map markers and extension type ids to callables "
+             "applied to their decoded value")
         .def("decode", &PyDecoder::decode,
              py::arg("data"),
              "Decode BTOON bytes to Python object")
+        .def("decode_many", &PyDecoder::decode_many,
+             py::arg("payloads"),
+             "Decode an iterable of BTOON payloads, returning a list")
         .def("decode_with_schema", &PyDecoder::decode_with_schema,
              py::arg("data"),
              py::arg("schema"),
@@ -114,12 +259,41 @@ PYBIND11_MODULE(btoon, m) {
         .def("decode_as_dataframe", &PyDecoder::decode_as_dataframe,
              py::arg("data"),
              "Decode tabular data as pandas DataFrame")
+        .def("read_frames", &PyDecoder::read_frames,
+             py::arg("path"),
+             "Decode every length-prefixed frame in a file via a memory map")
         .def("__enter__", &PyDecoder::__enter__,
              py::return_value_policy::reference_internal)
         .def("__exit__", &PyDecoder::__exit__);
 
+    // Extension values (type code + raw payload)
+    py::class_<btoon::Extension>(m, "Extension")
+        .def(py::init([](int8_t type, const py::buffer& data) {
+                 ContiguousBytes bytes(data);
+                 auto payload = bytes.span();
+                 return btoon::Extension{type, {payload.begin(), payload.end()}};
+             }),
+             py::arg("type"),
+             py::arg("data"),
+             "Create an extension value to encode as-is")
+        .def_readonly("type", &btoon::Extension::type)
+        .def_property_readonly("data", [](const btoon::Extension& e) {
+            return py::bytes(reinterpret_cast<const char*>(e.data.data()), e.data.size());
+        })
+        .def(py::self == py::self)
+        .def("__repr__", [](const btoon::Extension& e) {
+            return "<Extension type=" + std::to_string(e.type) + " size=" +
+                   std::to_string(e.data.size()) + ">";
+        });
+
     // Schema support
-    py::class_<btoon::Schema, std::shared_ptr<btoon::Schema>>(m, "Schema")
+    py::class_<PyCompiledSchema>(m, "CompiledSchema")
+        .def("__len__", &PyCompiledSchema::size);
+
+    py::class_<btoon::Schema, std::shared_ptr<btoon::Schema>>(m, "Schema", py::dynamic_attr())
+        .def("compile_encoder", [](const btoon::Schema& s) {
+            return PyCompiledSchema(s);
+        }, "Build a schema-specialized encoding plan for Encoder.encode_compiled")
         .def("validate", py::overload_cast<const btoon::Value&>(&btoon::Schema::validate, py::const_),
              py::arg("value"),
              "Validate a value against schema")
@@ -127,6 +301,9 @@ PYBIND11_MODULE(btoon, m) {
         .def("get_version", [](const btoon::Schema& s) {
             return s.getVersion().toString();
         })
+        .def("to_dict", [](const btoon::Schema& s) {
+            return PyDecoder().to_python(s.toValue());
+        }, "Schema definition as a dict (name, version, fields, ...)")
         .def("__repr__", [](const btoon::Schema& s) {
             return "<Schema '" + s.getName() + "' v" + s.getVersion().toString() + ">";
         });
@@ -149,6 +326,10 @@ PYBIND11_MODULE(btoon, m) {
              py::arg("default_value") = py::none(),
              py::return_value_policy::reference_internal,
              "Add a field to the schema")
+        .def("add_fields_bulk", &PySchemaBuilder::add_fields_bulk,
+             py::arg("fields"),
+             py::return_value_policy::reference_internal,
+             "Add fields from a list of {'name', 'type', 'required', 'default'} dicts")
         .def("required_field", &PySchemaBuilder::required_field,
              py::arg("name"),
              py::arg("type"),
@@ -163,6 +344,11 @@ PYBIND11_MODULE(btoon, m) {
         .def("build", &PySchemaBuilder::build,
              "Build the schema");
 
+    m.def("validate_batch", &validate_batch,
+          py::arg("schema"),
+          py::arg("records"),
+          "Validate an iterable of records against a schema, returning a list of bools");
+
     // Validator
     py::class_<PyValidator>(m, "Validator")
         .def(py::init<size_t, size_t, bool>(),
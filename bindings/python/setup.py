@@ -20,14 +20,32 @@ def read_long_description():
         return "BTOON - Binary Tree Object Notation for Python"
 
 # Platform-specific compiler flags
-extra_compile_args = ["-std=c++20", "-O3"]
-extra_link_args = []
+extra_compile_args = ["-std=c++20", "-O3", "-flto", "-fvisibility=hidden"]
+extra_link_args = ["-flto"]
+
+# ISA baseline: the compiler's portable default unless opted in, since the
+# binary must run on every CPU it is installed on. BTOON_NATIVE_ARCH=1
+# targets x86-64-v3 (AVX2/BMI2); BTOON_NATIVE=1 the build machine's own ISA.
+IS_X86_64 = platform.machine().lower() in ("x86_64", "amd64")
+NATIVE_ARCH = bool(os.environ.get("BTOON_NATIVE_ARCH"))
+NATIVE = bool(os.environ.get("BTOON_NATIVE"))
 
 if platform.system() == "Windows":
-    extra_compile_args = ["/std:c++20", "/O2"]
-elif platform.system() == "Darwin":
-    extra_compile_args.extend(["-stdlib=libc++", "-mmacosx-version-min=10.14"])
-    extra_link_args.extend(["-stdlib=libc++"])
+    extra_compile_args = ["/std:c++20", "/O2", "/GL"]
+    extra_link_args = ["/LTCG"]
+    if IS_X86_64 and (NATIVE_ARCH or NATIVE):
+        extra_compile_args.append("/arch:AVX2")
+else:
+    if NATIVE:
+        extra_compile_args.append("-march=native")
+    elif IS_X86_64 and NATIVE_ARCH:
+        extra_compile_args.append("-march=x86-64-v3")
+    
+    if platform.system() == "Darwin":
+        extra_compile_args.extend(["-stdlib=libc++", "-mmacosx-version-min=10.14"])
+        extra_link_args.extend(["-stdlib=libc++"])
+    else:
+        extra_compile_args.append("-fno-plt")
 
 # Check for optional compression libraries
 libraries = []
@@ -58,6 +76,7 @@ ext_modules = [
             # Include directories
             pybind11.get_include(),
             "../../include",
+            "../../include/third_party",
             "/usr/local/include",
         ],
         libraries=libraries,
@@ -86,7 +105,7 @@ setup(
     ext_modules=ext_modules,
     cmdclass={"build_ext": build_ext},
     zip_safe=False,
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     install_requires=[
         "pybind11>=2.6.0",
     ],
@@ -107,7 +126,6 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
@@ -6,8 +6,29 @@ Demonstrates idiomatic Python API usage
 
 import btoon
 import datetime
+import time
 from pathlib import Path
 
+# Encoders shared by all examples rather than set up per call
+ENCODER = btoon.Encoder()
+COMPRESSING_ENCODER = btoon.Encoder(compress=True)
+
+# Tags shared by every streamed record; a tuple, since the encoder never
+# needs to mutate it
+STREAM_TAGS = ("tag0", "tag1", "tag2")
+
+# Built once using the builder pattern and reused on every call
+USER_SCHEMA = (btoon.SchemaBuilder("User")
+    .version("0.0.1")
+    .description("User profile schema")
+    .required_field("id", "int")
+    .required_field("username", "string")
+    .optional_field("email", "string")
+    .optional_field("age", "int")
+    .field("active", "boolean", required=False, default_value=True)
+    .build()
+)
+
 def basic_example():
     """Basic encoding and decoding"""
     print("=== Basic Example ===")
@@ -25,17 +46,17 @@ def basic_example():
     }
     
     # Encode to BTOON
-    encoded = btoon.dumps(data)
+    encoded = ENCODER.encode(data)
     print(f"Encoded size: {len(encoded)} bytes")
     
     # Decode back
     decoded = btoon.loads(encoded)
     print(f"Decoded: {decoded}")
     
-    # With compression
-    compressed = btoon.dumps(data, compress=True)
-    print(f"Compressed size: {len(compressed)} bytes")
-    print(f"Compression ratio: {len(encoded)/len(compressed):.2f}x")
+    # With compression; only the size is needed, so no bytes are built
+    compressed_size = COMPRESSING_ENCODER.encoded_size(data)
+    print(f"Compressed size: {compressed_size} bytes")
+    print(f"Compression ratio: {len(encoded)/compressed_size:.2f}x")
     print()
 
 
@@ -43,18 +64,6 @@ def schema_example():
     """Schema definition and validation"""
     print("=== Schema Example ===")
     
-    # Create a schema using builder pattern
-    user_schema = (btoon.SchemaBuilder("User")
-        .version("0.0.1")
-        .description("User profile schema")
-        .required_field("id", "int")
-        .required_field("username", "string")
-        .optional_field("email", "string")
-        .optional_field("age", "int")
-        .field("active", "boolean", required=False, default_value=True)
-        .build()
-    )
-    
     # Valid data
     user = {
         "id": 1,
@@ -64,8 +73,8 @@ def schema_example():
     }
     
     # Encode with schema validation
-    encoder = btoon.Encoder()
-    encoded = encoder.encode_with_schema(user, user_schema)
+    encoder = ENCODER
+    encoded = encoder.encode_with_schema(user, USER_SCHEMA)
     print(f"Valid user encoded: {len(encoded)} bytes")
     
     # Invalid data (missing required field)
@@ -75,7 +84,7 @@ def schema_example():
     }
     
     try:
-        encoder.encode_with_schema(invalid_user, user_schema)
+        encoder.encode_with_schema(invalid_user, USER_SCHEMA)
     except btoon.BtoonException as e:
         print(f"Schema validation failed: {e}")
     print()
@@ -89,14 +98,21 @@ def streaming_example():
     output_file = Path("stream_example.btoon")
     
     with output_file.open("wb") as f:
-        with btoon.StreamEncoder(f, compress=True) as encoder:
+        # Records are compressed together in blocks of up to 1 MiB; each
+        # write is encoded before it returns, so a single record dict can
+        # be updated in place and reused
+        with btoon.StreamEncoder(f, compress=True, block_size=1 << 20) as encoder:
+            # One timestamp for the whole batch, as integer epoch
+            # nanoseconds rather than a formatted string
+            record = {
+                "id": 0,
+                "timestamp_ns": time.time_ns(),
+                "value": 0.0,
+                "tags": STREAM_TAGS
+            }
             for i in range(100):
-                record = {
-                    "id": i,
-                    "timestamp": datetime.datetime.now().isoformat(),
-                    "value": i * 1.5,
-                    "tags": [f"tag{j}" for j in range(3)]
-                }
+                record["id"] = i
+                record["value"] = i * 1.5
                 encoder.write(record)
     
     print(f"Wrote 100 records to {output_file}")
@@ -121,17 +137,21 @@ def context_manager_example():
     """Using context managers for encoding/decoding"""
     print("=== Context Manager Example ===")
     
-    # Encoder context manager with options
+    # Encoder context manager with options; both messages are encoded
+    # back to back into one reusable buffer instead of two bytes objects
+    scratch = bytearray()
     with btoon.encoder(compress=True, compression="lz4") as enc:
-        data1 = enc.encode({"message": "Hello"})
-        data2 = enc.encode({"message": "World"})
-        print(f"Encoded 2 messages: {len(data1)} + {len(data2)} bytes")
+        n1 = enc.encode_into({"message": "Hello"}, scratch)
+        n2 = enc.encode_into({"message": "World"}, scratch, n1)
+        print(f"Encoded 2 messages: {n1} + {n2} bytes")
     
-    # Decoder context manager
+    # Decoder context manager, decoding in place from the buffer
+    view = memoryview(scratch)
     with btoon.decoder(strict=True) as dec:
-        msg1 = dec.decode(data1)
-        msg2 = dec.decode(data2)
+        msg1 = dec.decode(view[:n1])
+        msg2 = dec.decode(view[n1:n1 + n2])
         print(f"Decoded: {msg1}, {msg2}")
+    view.release()
     print()
 
 
@@ -150,14 +170,12 @@ def pandas_integration():
             "category": ["A", "B"] * 5
         })
         
-        # Convert to records and encode
-        records = df.to_dict("records")
-        encoded = btoon.dumps(records, compress=True)
+        # Encode column by column, without building per-row dicts
+        encoded = btoon.dumps_dataframe(df, compress=True)
         print(f"DataFrame encoded: {len(encoded)} bytes")
         
-        # Decode and convert back to DataFrame
-        decoder = btoon.Decoder()
-        decoded_df = decoder.decode_as_dataframe(encoded)
+        # Decode back to a DataFrame
+        decoded_df = btoon.loads_dataframe(encoded)
         print(f"Decoded DataFrame shape: {decoded_df.shape}")
         
     except ImportError:
@@ -194,7 +212,7 @@ def file_operations():
     print(f"Validation: {validation}")
     
     # Convert to/from JSON
-    json_str = btoon.to_json(btoon.dumps(data), indent=2)
+    json_str = btoon.to_json(ENCODER.encode(data), indent=2)
     print(f"As JSON:\n{json_str[:100]}...")
     
     # Clean up
@@ -225,12 +225,23 @@ struct EncodeOptions {
     bool adaptive_compression = false;  // Auto-select best algorithm based on data
     size_t min_compression_size = 256;  // Minimum size to compress
     
+    // Multithreaded ZSTD: worker threads for compression (0 = calling thread,
+    // -1 = one per hardware thread for payloads larger than 1 MiB)
+    int compression_workers = 0;
+    // Split ZSTD output into independent frames of this many input bytes so
+    // they can be decompressed in parallel (0 = single frame)
+    size_t compression_frame_size = 0;
+    // ZSTD dictionary used when compressing with ZSTD (empty = none)
+    std::vector<uint8_t> compression_dictionary;
+    
     // Potentially add security options here in the future
 };
 
 struct DecodeOptions {
     bool auto_decompress = true;
     bool strict = true;
+    // ZSTD dictionary the payload was compressed with (empty = none)
+    std::vector<uint8_t> compression_dictionary;
     // Potentially add security options here in the future
 };
 
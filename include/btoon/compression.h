@@ -19,6 +19,7 @@
 #define BTOON_COMPRESSION_H
 
 #include <cstdint>
+#include <optional>
 #include <vector>
 #include <span>
 
@@ -141,8 +142,43 @@ std::vector<uint8_t> decompress_lz4(std::span<const uint8_t> compressed_data);
 #endif
 
 #ifdef BTOON_WITH_ZSTD
-std::vector<uint8_t> compress_zstd(std::span<const uint8_t> data, int level);
-std::vector<uint8_t> decompress_zstd(std::span<const uint8_t> compressed_data);
+/**
+ * @brief Compresses data with Zstandard.
+ *
+ * @param workers Number of ZSTD worker threads (ZSTD_c_nbWorkers); 0 compresses
+ *                on the calling thread. Ignored if libzstd lacks multithreading.
+ * @param frame_size If non-zero, split the input into chunks of this many bytes
+ *                   and emit one independent frame per chunk (pzstd-compatible),
+ *                   so the frames can be decompressed in parallel.
+ * @param dictionary Optional ZSTD dictionary (see train_zstd_dictionary); the
+ *                   same dictionary is required to decompress.
+ */
+std::vector<uint8_t> compress_zstd(std::span<const uint8_t> data, int level, int workers = 0,
+                                   size_t frame_size = 0,
+                                   std::span<const uint8_t> dictionary = {});
+
+/**
+ * @brief Decompresses one or more concatenated Zstandard frames.
+ *
+ * Multi-frame input is decompressed on several threads.
+ *
+ * @param expected_size If set, the frames' declared content sizes must add up
+ *                      to exactly this many bytes; checked before allocating.
+ */
+std::vector<uint8_t> decompress_zstd(std::span<const uint8_t> compressed_data,
+                                     std::span<const uint8_t> dictionary = {},
+                                     std::optional<size_t> expected_size = std::nullopt);
+
+/**
+ * @brief Trains a ZSTD dictionary from sample payloads (ZDICT_trainFromBuffer).
+ *
+ * Dictionaries help most for many small, similar messages.
+ *
+ * @param samples Representative payloads.
+ * @param dict_capacity Maximum dictionary size in bytes.
+ */
+std::vector<uint8_t> train_zstd_dictionary(const std::vector<std::vector<uint8_t>>& samples,
+                                           size_t dict_capacity = 112640);
 #endif
 
 #ifdef BTOON_WITH_BROTLI
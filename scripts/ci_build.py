@@ -8,19 +8,33 @@ import os
 import sys
 import subprocess
 import argparse
+import hashlib
 import json
+import re
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import IO, List, Dict, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Colors only when writing to a terminal; CI logs get plain text
+_TTY = sys.stdout.isatty()
 
 class Colors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+    HEADER = '\033[95m' if _TTY else ''
+    OKBLUE = '\033[94m' if _TTY else ''
+    OKCYAN = '\033[96m' if _TTY else ''
+    OKGREEN = '\033[92m' if _TTY else ''
+    WARNING = '\033[93m' if _TTY else ''
+    FAIL = '\033[91m' if _TTY else ''
+    ENDC = '\033[0m' if _TTY else ''
+    BOLD = '\033[1m' if _TTY else ''
 
 def print_header(msg: str):
     print(f"{Colors.HEADER}{Colors.BOLD}{msg}{Colors.ENDC}")
@@ -37,84 +51,99 @@ def print_info(msg: str):
 def print_warning(msg: str):
     print(f"{Colors.WARNING}⚠ {msg}{Colors.ENDC}")
 
-def run_command(cmd: List[str], cwd: Optional[Path] = None, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a command and return the result"""
+# Shell metacharacters rejected in command arguments
+_UNSAFE = re.compile(r"[;&|`$()<>\n\r]")
+
+def check_safe(value: str, what: str) -> str:
+    """Return value, raising ValueError if it contains shell metacharacters"""
+    if _UNSAFE.search(value):
+        raise ValueError(f"Unsafe {what} detected: {value}")
+    return value
+
+@lru_cache(maxsize=None)
+def find_tool(name: str) -> Optional[str]:
+    """Return the full path of a program on PATH, or None; looked up once per name"""
+    return shutil.which(name)
+
+def prepare_command(cmd: List[str]) -> List[str]:
+    """Validate a command's arguments, log it and resolve its program path"""
     # Sanitize command - ensure all arguments are strings and don't contain shell metacharacters
     sanitized_cmd = []
     for arg in cmd:
         if not isinstance(arg, str):
             arg = str(arg)
         # Basic sanitization - reject arguments with shell metacharacters
-        if any(char in arg for char in [';', '&', '|', '`', '$', '(', ')', '<', '>', '\n', '\r']):
-            raise ValueError(f"Unsafe command argument detected: {arg}")
-        sanitized_cmd.append(arg)
+        sanitized_cmd.append(check_safe(arg, "command argument"))
     
     print_info(f"Running: {' '.join(sanitized_cmd)}")
-    try:
-        result = subprocess.run(
-            sanitized_cmd,
-            cwd=cwd,
-            check=check,
-            capture_output=True,
-            text=True
-        )
-        if result.stdout:
-            print(result.stdout)
-        return result
-    except subprocess.CalledProcessError as e:
-        if e.stderr:
-            print_error(e.stderr)
-        raise
+    
+    # subprocess launches via posix_spawn instead of fork+exec only when the
+    # program path has a directory part, close_fds is False and there is no
+    # preexec_fn/pass_fds; don't add those here. Our descriptors are
+    # non-inheritable by default, so not closing them leaks nothing.
+    if not os.path.dirname(sanitized_cmd[0]):
+        sanitized_cmd[0] = find_tool(sanitized_cmd[0]) or sanitized_cmd[0]
+    
+    # Keep our own buffered output ahead of the child's
+    sys.stdout.flush()
+    return sanitized_cmd
+
+def run_command(cmd: List[str], cwd: Optional[Path] = None,
+                check: bool = True) -> subprocess.CompletedProcess:
+    """Run a command and return the result
+
+    Output goes straight to this process's stdout/stderr.
+    """
+    return subprocess.run(
+        prepare_command(cmd),
+        cwd=cwd,
+        check=check,
+        close_fds=False
+    )
 
 def configure_cmake(build_dir: Path, options: Dict[str, str] = None) -> Path:
-    """Configure CMake build"""
+    """Configure CMake build
+
+    Skipped when build_dir was already configured with the same options.
+    """
     options = options or {}
     build_dir.mkdir(parents=True, exist_ok=True)
     
-    # Sanitize build_dir path
-    build_dir_str = str(build_dir.resolve())
-    if any(char in build_dir_str for char in [';', '&', '|', '`', '$', '(', ')', '<', '>', '\n', '\r']):
-        raise ValueError(f"Unsafe build directory path detected: {build_dir_str}")
+    options_hash = hashlib.sha256(
+        json.dumps(sorted(options.items())).encode()).hexdigest()
+    hash_file = build_dir / ".btoon_ci_options.sha256"
+    if ((build_dir / "CMakeCache.txt").exists() and hash_file.exists()
+            and hash_file.read_text().strip() == options_hash):
+        print_info("CMake options unchanged, skipping configure")
+        return build_dir
     
     cmake_args = [
         "cmake",
         "-S", ".",
-        "-B", build_dir_str,
+        "-B", str(build_dir),
         "-DCMAKE_BUILD_TYPE=Release",
     ]
     
     for key, value in options.items():
         # Sanitize CMake option values
-        if any(char in str(value) for char in [';', '&', '|', '`', '$', '(', ')', '<', '>', '\n', '\r']):
-            raise ValueError(f"Unsafe CMake option value detected: {key}={value}")
+        check_safe(str(value), f"CMake option value for {key}")
         cmake_args.append(f"-D{key}={value}")
     
     run_command(cmake_args)
+    hash_file.write_text(options_hash)
     return build_dir
 
 def build_project(build_dir: Path, target: str = None) -> None:
     """Build the project"""
-    # Sanitize build_dir path
-    build_dir_str = str(build_dir.resolve())
-    if any(char in build_dir_str for char in [';', '&', '|', '`', '$', '(', ')', '<', '>', '\n', '\r']):
-        raise ValueError(f"Unsafe build directory path detected: {build_dir_str}")
-    
-    cmd = ["cmake", "--build", build_dir_str]
+    cmd = ["cmake", "--build", str(build_dir)]
     if target:
-        # Sanitize target name
-        if any(char in target for char in [';', '&', '|', '`', '$', '(', ')', '<', '>', '\n', '\r']):
-            raise ValueError(f"Unsafe target name detected: {target}")
         cmd.extend(["--target", target])
     run_command(cmd)
 
 def run_tests(build_dir: Path) -> bool:
     """Run tests"""
     try:
-        # Sanitize build_dir path
-        build_dir_str = str(build_dir.resolve())
-        if any(char in build_dir_str for char in [';', '&', '|', '`', '$', '(', ')', '<', '>', '\n', '\r']):
-            raise ValueError(f"Unsafe build directory path detected: {build_dir_str}")
-        run_command(["ctest", "--test-dir", build_dir_str, "--output-on-failure"])
+        run_command(["ctest", "--test-dir", str(build_dir), "--output-on-failure"])
         return True
     except subprocess.CalledProcessError:
         return False
@@ -127,32 +156,50 @@ def run_benchmarks(build_dir: Path) -> Dict:
         return {}
     
     try:
-        # Sanitize benchmark_exe path
-        benchmark_exe_str = str(benchmark_exe.resolve())
-        if any(char in benchmark_exe_str for char in [';', '&', '|', '`', '$', '(', ')', '<', '>', '\n', '\r']):
-            raise ValueError(f"Unsafe benchmark executable path detected: {benchmark_exe_str}")
-        result = run_command([benchmark_exe_str, "--benchmark_format=json"])
-        return json.loads(result.stdout)
+        # JSON goes straight to a file (console output still streams), then
+        # is read in one exact-size read and parsed from the bytes
+        results_file = build_dir / "benchmark_results.json"
+        run_command([str(benchmark_exe),
+                     f"--benchmark_out={results_file}",
+                     "--benchmark_out_format=json"])
+        data = results_file.read_bytes()
+        if HAS_ORJSON:
+            return orjson.loads(data)
+        return json.loads(data)
     except Exception as e:
         print_error(f"Failed to run benchmarks: {e}")
         return {}
 
-def run_snyk_scan(source_dir: Path) -> bool:
-    """Run Snyk code scan"""
-    try:
-        # Note: This requires Snyk CLI to be installed and authenticated
-        # Convert Path to string and validate it doesn't contain shell metacharacters
-        source_path_str = str(source_dir.resolve())
-        if any(char in source_path_str for char in [';', '&', '|', '`', '$', '(', ')', '<', '>', '\n', '\r']):
-            raise ValueError(f"Unsafe path detected: {source_path_str}")
-        result = run_command(
-            ["snyk", "code", "test", source_path_str],
-            check=False
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
+def start_snyk_scan(source_dir: Path) -> Optional[Tuple[subprocess.Popen, IO[bytes]]]:
+    """Start a Snyk code scan in the background
+
+    Returns the process and the temporary file its report is written to,
+    or None if the Snyk CLI is not installed. The report is kept out of
+    the console until finish_snyk_scan so it isn't interleaved with the
+    phases running meanwhile.
+    """
+    # Note: This requires Snyk CLI to be installed and authenticated
+    if not find_tool("snyk"):
         print_warning("Snyk CLI not found, skipping security scan")
-        return True  # Don't fail if Snyk is not available
+        return None  # Don't fail if Snyk is not available
+    
+    report = tempfile.TemporaryFile()
+    process = subprocess.Popen(
+        prepare_command(["snyk", "code", "test", str(source_dir)]),
+        stdout=report,
+        stderr=subprocess.STDOUT,
+        close_fds=False
+    )
+    return process, report
+
+def finish_snyk_scan(scan: Tuple[subprocess.Popen, IO[bytes]]) -> bool:
+    """Wait for a scan from start_snyk_scan, print its report and return whether it passed"""
+    process, report = scan
+    returncode = process.wait()
+    with report:
+        report.seek(0)
+        sys.stdout.write(report.read().decode(errors="replace"))
+    return returncode == 0
 
 def main():
     parser = argparse.ArgumentParser(description="CI build script for BTOON Core")
@@ -168,8 +215,12 @@ def main():
     
     args = parser.parse_args()
     
-    source_dir = Path(__file__).parent.parent
+    # Paths are resolved and checked for shell metacharacters once here;
+    # the helpers below receive them already validated
+    source_dir = Path(__file__).resolve().parent.parent
     build_dir = args.build_dir.resolve()
+    check_safe(str(source_dir), "source directory path")
+    check_safe(str(build_dir), "build directory path")
     
     print_header("BTOON Core CI Build")
     print_info(f"Source directory: {source_dir}")
@@ -194,30 +245,45 @@ def main():
         build_project(build_dir)
         print_success("Build completed")
     
-    # Run tests
-    if args.tests:
-        print_header("Running tests")
-        if run_tests(build_dir):
-            print_success("All tests passed")
-        else:
-            print_error("Tests failed")
-            sys.exit(1)
-    
-    # Run benchmarks
-    if args.benchmarks:
-        print_header("Running benchmarks")
-        results = run_benchmarks(build_dir)
-        if results:
-            print_success(f"Benchmarks completed ({len(results.get('benchmarks', []))} benchmarks)")
-    
-    # Run Snyk scan
+    # The Snyk scan is network-bound and only reads the source tree, so
+    # it overlaps the local phases. Tests and benchmarks stay sequential
+    # so benchmark timings aren't skewed by a concurrent test run.
+    snyk_scan = None
     if args.snyk:
-        print_header("Running Snyk security scan")
-        if run_snyk_scan(source_dir):
-            print_success("Security scan passed")
-        else:
-            print_error("Security scan found issues")
-            sys.exit(1)
+        print_header("Starting Snyk security scan")
+        snyk_scan = start_snyk_scan(source_dir)
+    
+    try:
+        # Run tests
+        if args.tests:
+            print_header("Running tests")
+            if run_tests(build_dir):
+                print_success("All tests passed")
+            else:
+                print_error("Tests failed")
+                sys.exit(1)
+        
+        # Run benchmarks
+        if args.benchmarks:
+            print_header("Running benchmarks")
+            results = run_benchmarks(build_dir)
+            if results:
+                print_success(f"Benchmarks completed ({len(results.get('benchmarks', []))} benchmarks)")
+        
+        # Collect Snyk scan
+        if snyk_scan is not None:
+            print_header("Snyk security scan")
+            if finish_snyk_scan(snyk_scan):
+                print_success("Security scan passed")
+            else:
+                print_error("Security scan found issues")
+                sys.exit(1)
+    finally:
+        # Failing early (or being interrupted) doesn't wait for the scan
+        if snyk_scan is not None and snyk_scan[0].poll() is None:
+            print_warning("Stopping unfinished Snyk security scan")
+            snyk_scan[0].kill()
+            snyk_scan[0].wait()
     
     print_header("CI build completed successfully")
     return 0
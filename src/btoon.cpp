@@ -18,6 +18,7 @@
 #include <stdexcept>
 #include <cstring>
 #include <chrono>
+#include <thread>
 
 namespace btoon {
 
@@ -31,6 +32,37 @@ struct CompressionHeader {
     uint32_t uncompressed_size;
 };
 const uint32_t BTOON_MAGIC = 0x42544F4E; // "BTON"
+const size_t AUTO_WORKERS_MIN_SIZE = 1 << 20;
+
+std::vector<uint8_t> compress_payload(CompressionAlgorithm algo, std::span<const uint8_t> data,
+                                      int level, const EncodeOptions& options) {
+#ifdef BTOON_WITH_ZSTD
+    if (algo == CompressionAlgorithm::ZSTD &&
+        (options.compression_workers != 0 || options.compression_frame_size != 0 ||
+         !options.compression_dictionary.empty())) {
+        int workers = options.compression_workers;
+        if (workers < 0) {
+            workers = data.size() > AUTO_WORKERS_MIN_SIZE
+                ? static_cast<int>(std::thread::hardware_concurrency())
+                : 0;
+        }
+        return compress_zstd(data, level, workers, options.compression_frame_size,
+                             options.compression_dictionary);
+    }
+#endif
+    return compress(algo, data, level);
+}
+
+std::vector<uint8_t> decompress_payload(CompressionAlgorithm algo, std::span<const uint8_t> data,
+                                        size_t uncompressed_size, const DecodeOptions& options) {
+#ifdef BTOON_WITH_ZSTD
+    if (algo == CompressionAlgorithm::ZSTD) {
+        // Frame sizes are checked against the header before allocating
+        return decompress_zstd(data, options.compression_dictionary, uncompressed_size);
+    }
+#endif
+    return decompress(algo, data);
+}
 } // namespace
 
 const char* Value::type_name() const {
@@ -60,39 +92,44 @@ std::vector<uint8_t> encode(const Value& value, const btoon::EncodeOptions& opti
     Encoder encoder;
     encoder.setOptions(options);
     encoder.encode(value);
-    auto encoded_data = encoder.getBuffer();
-    std::vector<uint8_t> result(encoded_data.begin(), encoded_data.end());
+    // Compressed straight from the encoder's buffer; only the uncompressed
+    // result is copied out of it
+    std::span<const uint8_t> result = encoder.getBuffer();
+    auto uncompressed = [&result] {
+        return std::vector<uint8_t>(result.begin(), result.end());
+    };
 
     if (options.compress) {
         // Skip compression for small data
         if (result.size() < options.min_compression_size) {
-            return result;
+            return uncompressed();
         }
         
         std::vector<uint8_t> compressed;
+        CompressionAlgorithm selected = CompressionAlgorithm::NONE;
         
         if (options.use_profile) {
             // Use compression profile
             compressed = compress(options.compression_profile, result);
         } else if (options.adaptive_compression) {
             // Auto-select best algorithm
-            CompressionAlgorithm algo = select_best_algorithm(result, 
+            selected = select_best_algorithm(result, 
                 options.compression_level <= 2 || options.compression_preset == CompressionLevel::FAST);
             
-            if (algo != CompressionAlgorithm::NONE) {
+            if (selected != CompressionAlgorithm::NONE) {
                 int level = options.compression_level;
                 if (level == 0 && options.compression_preset != CompressionLevel::CUSTOM) {
-                    level = get_numeric_level(algo, options.compression_preset);
+                    level = get_numeric_level(selected, options.compression_preset);
                 }
-                compressed = compress(algo, result, level);
+                compressed = compress_payload(selected, result, level, options);
             } else {
-                return result; // No compression beneficial
+                return uncompressed(); // No compression beneficial
             }
         } else {
             // Use specified algorithm and level
             CompressionAlgorithm algo = options.compression_algorithm;
             if (algo == CompressionAlgorithm::NONE) {
-                return result;
+                return uncompressed();
             }
             
             int level = options.compression_level;
@@ -100,7 +137,7 @@ std::vector<uint8_t> encode(const Value& value, const btoon::EncodeOptions& opti
                 level = get_numeric_level(algo, options.compression_preset);
             }
             
-            compressed = compress(algo, result, level);
+            compressed = compress_payload(algo, result, level, options);
         }
         
         // Only use compressed if it's actually smaller
@@ -112,9 +149,7 @@ std::vector<uint8_t> encode(const Value& value, const btoon::EncodeOptions& opti
             
             // Store the actual algorithm used (not the original which might be AUTO)
             if (options.adaptive_compression) {
-                CompressionAlgorithm actual_algo = select_best_algorithm(result, 
-                    options.compression_level <= 2 || options.compression_preset == CompressionLevel::FAST);
-                header.algorithm = static_cast<uint8_t>(actual_algo);
+                header.algorithm = static_cast<uint8_t>(selected);
             } else if (options.use_profile && options.compression_profile.algorithm == CompressionAlgorithm::AUTO) {
                 CompressionAlgorithm actual_algo = select_best_algorithm(result, options.compression_profile.numeric_level <= 3);
                 header.algorithm = static_cast<uint8_t>(actual_algo);
@@ -139,7 +174,7 @@ std::vector<uint8_t> encode(const Value& value, const btoon::EncodeOptions& opti
         }
     }
 
-    return result;
+    return uncompressed();
 }
 
 Value decode(std::span<const uint8_t> data, const btoon::DecodeOptions& options) {
@@ -164,7 +199,8 @@ Value decode(std::span<const uint8_t> data, const btoon::DecodeOptions& options)
                 CompressionAlgorithm algo = static_cast<CompressionAlgorithm>(header.algorithm);
                 
                 try {
-                    decompressed = decompress(algo, compressed_data);
+                    decompressed = decompress_payload(algo, compressed_data,
+                                                      header.uncompressed_size, options);
                     
                     // Validate decompressed size
                     if (decompressed.size() != header.uncompressed_size) {
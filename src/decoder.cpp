@@ -396,8 +396,9 @@ Value Decoder::decodeExtension(std::span<const uint8_t> buffer, size_t& pos) con
         default: { // Generic extension
             Extension ext;
             ext.type = ext_type;
-            ext.data.assign(buffer.begin() + pos, buffer.begin() + pos + len - 1); // len - 1 because ext_type is already read
-            pos += (len - 1);
+            // len counts payload bytes only; the type byte was read above
+            ext.data.assign(buffer.begin() + pos, buffer.begin() + pos + len);
+            pos += len;
             return ext;
         }
     }
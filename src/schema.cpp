@@ -42,7 +42,11 @@ public:
     SchemaImpl(const std::string& name, const SchemaVersion& version, 
                const std::vector<SchemaField>& fields)
         : name_(name), version_(version), fields_(fields),
-          evolution_strategy_(EvolutionStrategy::BACKWARD_COMPATIBLE) {}
+          evolution_strategy_(EvolutionStrategy::BACKWARD_COMPATIBLE) {
+        for (const auto& field : fields_) {
+            compilePattern(field);
+        }
+    }
 
     // Validation
     bool validate(const Value& value) const {
@@ -110,6 +114,7 @@ public:
     // Field management
     void addField(const SchemaField& field) {
         fields_.push_back(field);
+        compilePattern(field);
     }
     
     void removeField(const std::string& field_name) {
@@ -318,6 +323,7 @@ public:
                         }
                         
                         fields_.push_back(field);
+                        compilePattern(field);
                     }
                 }
             }
@@ -437,6 +443,28 @@ private:
     };
     std::unordered_map<MigrationKey, MigrationFunction, MigrationKeyHash> migrations_;
     
+    // "pattern" constraints compiled once when fields are added, keyed by source
+    std::unordered_map<std::string, std::regex> patterns_;
+    
+    void compilePattern(const SchemaField& field) {
+        if (!field.constraints.has_value()) {
+            return;
+        }
+        const Map* constraint_map = std::get_if<Map>(&field.constraints.value());
+        if (!constraint_map || !constraint_map->count("pattern")) {
+            return;
+        }
+        const String* pattern = std::get_if<String>(&constraint_map->at("pattern"));
+        if (!pattern || patterns_.count(*pattern)) {
+            return;
+        }
+        try {
+            patterns_.emplace(*pattern, std::regex(*pattern, std::regex::ECMAScript | std::regex::optimize));
+        } catch (const std::regex_error&) {
+            // Left uncompiled; validation reports the bad pattern as before
+        }
+    }
+    
     bool validateType(const Value& value, const std::string& expected_type) const {
         if (expected_type == "string") {
             return std::holds_alternative<String>(value);
@@ -504,8 +532,11 @@ private:
             if (const String* str_val = std::get_if<String>(&value)) {
                 const String* pattern = std::get_if<String>(&constraint_map->at("pattern"));
                 if (pattern) {
-                    std::regex re(*pattern);
-                    if (!std::regex_match(*str_val, re)) {
+                    auto compiled = patterns_.find(*pattern);
+                    bool matched = compiled != patterns_.end()
+                        ? std::regex_match(*str_val, compiled->second)
+                        : std::regex_match(*str_val, std::regex(*pattern));
+                    if (!matched) {
                         return false;
                     }
                 }
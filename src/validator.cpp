@@ -170,6 +170,7 @@ bool TypeValidator::validateExtension(const Extension& ext) {
         case -4:   // BigInt
         case -5:   // VectorFloat
         case -6:   // VectorDouble
+        case -7:   // Decimal (sign, exponent, coefficient)
         case -10:  // Tabular data
             return true;
         default:
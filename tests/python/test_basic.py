@@ -0,0 +1,124 @@
+"""
+Round-trip tests for the core Python API (btoon package)
+"""
+
+import gzip
+
+import btoon
+import pytest
+
+
+@pytest.mark.parametrize("obj", [
+    None,
+    True,
+    0,
+    -1,
+    2**63 - 1,
+    1.5,
+    "",
+    "héllo",
+    b"\x00\xff",
+    [1, "two", 3.0],
+    {"name": "Alice", "tags": ["a", "b"], "nested": {"x": None}},
+])
+def test_dumps_loads_roundtrip(obj):
+    assert btoon.loads(btoon.dumps(obj)) == obj
+
+
+def test_compressed_roundtrip():
+    obj = {"values": list(range(1000))}
+    assert btoon.loads(btoon.dumps(obj, compress=True)) == obj
+
+
+def test_schema_builder():
+    schema = (btoon.SchemaBuilder("User")
+              .version("1.2.3")
+              .required_field("id", "int")
+              .optional_field("email", "string", default_value="")
+              .build())
+    assert schema.get_name() == "User"
+    assert schema.get_version() == "1.2.3"
+
+
+def test_validator():
+    validator = btoon.Validator()
+    assert validator.is_valid(btoon.dumps({"a": 1}))
+    assert validator.validate(btoon.dumps([1, 2]))["valid"]
+
+
+def test_memoryview_encodes_logical_bytes():
+    data = bytes(range(16))
+    for view in [memoryview(data), memoryview(data)[::2], memoryview(data)[1::3]]:
+        assert btoon.loads(btoon.dumps(view)) == bytes(view)
+
+
+def test_decode_from_strided_buffer():
+    payload = btoon.dumps({"key": [1, 2, 3]})
+    # Interleave the payload with filler bytes, then view every other byte
+    spread = bytearray(len(payload) * 2)
+    spread[::2] = payload
+    view = memoryview(spread)[::2]
+    assert btoon.loads(view) == {"key": [1, 2, 3]}
+    assert btoon.to_json(view) == '{"key": [1, 2, 3]}'
+    assert btoon._native.Extension(5, view).data == payload
+
+
+def test_add_fields_bulk():
+    builder = btoon.SchemaBuilder("Row")
+    builder.add_fields_bulk([{"name": "id", "type": "int"},
+                             {"name": "note", "type": "string", "required": False}])
+    assert builder.build().get_name() == "Row"
+    with pytest.raises(TypeError):
+        btoon.SchemaBuilder("Row").add_fields_bulk([{"name": "id", "type": "int"}, ("x", "int")])
+
+
+def test_data_parameters_are_positional_only():
+    with pytest.raises(TypeError):
+        btoon.dumps(obj={"a": 1})
+    with pytest.raises(TypeError):
+        btoon.loads(data=btoon.dumps({"a": 1}))
+    assert btoon.loads(btoon.dumps({"a": 1}), strict=True) == {"a": 1}
+
+
+def _defaults(schema):
+    return {f["name"]: f.get("default") for f in schema.to_dict()["fields"]}
+
+
+def test_add_fields_bulk_keeps_defaults():
+    builder = btoon.SchemaBuilder("Row")
+    builder.add_fields_bulk([{"name": "id", "type": "int"},
+                             {"name": "status", "type": "string", "required": False,
+                              "default": "active"}])
+    assert _defaults(builder.build()) == {"id": None, "status": "active"}
+    
+    schema = btoon.create_schema("Row", [{"name": "count", "type": "int", "default": 3}])
+    assert _defaults(schema) == {"count": 3}
+
+
+def test_create_schema_cache_distinguishes_equal_values_of_other_types():
+    for default in [1, True, 1.0, 0, False, (1, 2), (True, 2)]:
+        schema = btoon.create_schema("Cached", [{"name": "x", "type": "any", "default": default}])
+        got = _defaults(schema)["x"]
+        want = list(default) if isinstance(default, tuple) else default
+        assert got == want and type(got) is type(want)
+        if isinstance(default, tuple):
+            assert [type(v) for v in got] == [type(v) for v in want]
+    
+    # Unhashable defaults are built without the cache
+    schema = btoon.create_schema("Cached", [{"name": "x", "type": "any", "default": [1, 2]}])
+    assert _defaults(schema)["x"] == [1, 2]
+
+
+def test_load_reads_files_and_wrappers(tmp_path):
+    obj = {"values": list(range(100))}
+    path = tmp_path / "data.btoon"
+    path.write_bytes(b"skip" + btoon.dumps(obj))
+    with open(path, "rb") as f:
+        f.read(4)
+        assert btoon.load(f) == obj
+    
+    # GzipFile.fileno() is the compressed file's descriptor
+    with gzip.open(tmp_path / "data.btoon.gz", "wb") as f:
+        btoon.dump(obj, f)
+    with gzip.open(tmp_path / "data.btoon.gz", "rb") as f:
+        assert btoon.load(f) == obj
@@ -0,0 +1,48 @@
+"""
+pandas DataFrame round-trip tests for btoon_enhanced
+"""
+
+import math
+
+import btoon
+import btoon_enhanced
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+
+def _roundtrip(df):
+    return btoon_enhanced.loads(btoon_enhanced.dumps(df))
+
+
+def test_string_column_roundtrip():
+    df = pd.DataFrame({"city": ["Oslo", "Rome", "Lima"] * 10, "n": range(30)})
+    decoded = _roundtrip(df)
+    assert decoded["city"].tolist() == df["city"].tolist()
+    assert decoded["n"].tolist() == df["n"].tolist()
+
+
+def test_mixed_object_column_keeps_types_and_values():
+    values = [1, True, 1.0, 0.0, -0.0, False, 0, "a", None] * 4
+    df = pd.DataFrame({"mixed": pd.Series(values, dtype=object)})
+    decoded = _roundtrip(df)["mixed"].tolist()
+    assert [type(v) for v in decoded] == [type(v) for v in values]
+    assert decoded == values
+    assert [math.copysign(1, v) for v in decoded if type(v) is float] == \
+           [math.copysign(1, v) for v in values if type(v) is float]
+
+
+FRAMES = {
+    "matrix": lambda: pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]}),
+    "dict_encoded": lambda: pd.DataFrame({"city": ["Oslo", "Rome"] * 8, "n": range(16)}),
+    "columns": lambda: pd.DataFrame({"x": [1, 2], "y": ["p", "q"]}, index=[10, 20]),
+}
+
+
+@pytest.mark.parametrize("layout", sorted(FRAMES))
+def test_core_and_enhanced_read_each_others_frames(layout):
+    df = FRAMES[layout]()
+    pd.testing.assert_frame_equal(btoon.loads_dataframe(btoon_enhanced.dumps(df)), df,
+                                  check_dtype=False)
+    pd.testing.assert_frame_equal(btoon_enhanced.loads(btoon.dumps_dataframe(df)), df,
+                                  check_dtype=False)
@@ -0,0 +1,75 @@
+"""
+JSON transcoding tests: btoon.to_json must match json.dumps and
+btoon.from_json must accept what json.loads accepts
+"""
+
+import json
+import math
+
+import btoon
+import pytest
+
+
+@pytest.mark.parametrize("obj", [
+    {"a": 1, "b": [True, False, None], "c": "text"},
+    [0.0001, 0.00001, 1e15, 1e16, 1.5e300, -0.0, 0.1, 123.456, 5e-324],
+    [-(2**63), 2**63 - 1, 0, -1],
+    ["héllo", "日本", "😀", "tab\there", "\x7f\x00", 'quote " back \\'],
+    [float("inf"), float("-inf")],
+])
+def test_to_json_matches_json_dumps(obj):
+    assert btoon.to_json(btoon.dumps(obj)) == json.dumps(obj)
+
+
+@pytest.mark.parametrize("obj", [
+    {"a": [1, 2.5, "x"], "nested": {"k": None}},
+    [float("inf"), float("-inf"), 1e-05, "😀"],
+    2**63 - 1,
+])
+def test_json_roundtrip(obj):
+    assert btoon.loads(btoon.from_json(btoon.to_json(btoon.dumps(obj)))) == obj
+
+
+def test_nan_roundtrip():
+    text = btoon.to_json(btoon.dumps([float("nan")]))
+    assert text == "[NaN]"
+    assert math.isnan(btoon.loads(btoon.from_json(text))[0])
+
+
+def test_from_json_accepts_non_finite_literals():
+    assert btoon.loads(btoon.from_json("[Infinity, -Infinity]")) == [float("inf"), float("-inf")]
+    assert math.isnan(btoon.loads(btoon.from_json("NaN")))
+
+
+def test_from_json_does_not_round_wide_integers():
+    assert btoon.loads(btoon.from_json(str(2**63 - 1))) == 2**63 - 1
+    # Not representable in BTOON; must fail like dumps(2**64), not become a float
+    with pytest.raises(Exception) as excinfo:
+        btoon.from_json(str(2**64))
+    with pytest.raises(type(excinfo.value)):
+        btoon.dumps(2**64)
+
+
+def test_from_json_rejects_invalid_json_like_json_loads():
+    with pytest.raises(json.JSONDecodeError):
+        btoon.from_json("{not json")
+
+
+def test_to_json_unserializable_raises_type_error():
+    with pytest.raises(TypeError):
+        btoon.to_json(btoon.dumps({"blob": b"\x00\x01"}))
+
+
+def test_to_json_with_options_and_batches():
+    payloads = btoon.dumps_many([{"a": 1}, [1, 2]])
+    assert btoon.to_json(payloads) == ['{"a": 1}', "[1, 2]"]
+    assert btoon.to_json(payloads[0], indent=2) == json.dumps({"a": 1}, indent=2)
+    assert btoon.loads_many(btoon.from_json(['{"a": 1}', "[1, 2]"])) == [{"a": 1}, [1, 2]]
+
+
+def test_from_json_accepts_dumps_options():
+    text = json.dumps({"values": list(range(100))})
+    schema = btoon.create_schema("Values", [{"name": "values", "type": "array"}])
+    for options in [{"compress": True}, {"workers": 0, "frame_size": 0}, {"schema": schema}]:
+        assert btoon.loads(btoon.from_json(text, **options)) == json.loads(text)
+    assert btoon.from_json([text], workers=0) == [btoon.dumps(json.loads(text), workers=0)]
@@ -0,0 +1,67 @@
+"""
+numpy array round-trip tests for btoon_enhanced
+"""
+
+import gc
+import weakref
+
+import btoon
+import btoon_enhanced
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def _roundtrip(obj):
+    return btoon_enhanced.loads(btoon_enhanced.dumps(obj))
+
+
+@pytest.mark.parametrize("arr", [
+    np.arange(12, dtype=np.int32).reshape(3, 4),
+    np.asfortranarray(np.arange(24, dtype=np.float64).reshape(2, 3, 4)),
+    np.arange(20, dtype=np.int16).reshape(4, 5)[:, ::2],
+    np.arange(5, dtype=np.uint8),
+])
+def test_array_roundtrip(arr):
+    decoded = _roundtrip({"a": arr})["a"]
+    assert decoded.dtype == arr.dtype
+    np.testing.assert_array_equal(decoded, arr)
+
+
+def test_fortran_array_keeps_layout_and_is_writable():
+    arr = np.asfortranarray(np.arange(6, dtype=np.int64).reshape(2, 3))
+    decoded = _roundtrip(arr)
+    np.testing.assert_array_equal(decoded, arr)
+    assert decoded.flags["F_CONTIGUOUS"]
+    assert decoded.flags["WRITEABLE"]
+
+
+def test_legacy_order_f_payload_holds_c_order_bytes():
+    # Payloads written before "layout" existed: C-order bytes flagged "order": "F"
+    arr = np.arange(6, dtype=np.int64).reshape(2, 3)
+    legacy = btoon.dumps({"__numpy__": {
+        "shape": [2, 3],
+        "dtype": "int64",
+        "data": arr.tobytes(),
+        "order": "F",
+    }})
+    decoded = btoon_enhanced.loads(legacy)
+    np.testing.assert_array_equal(decoded, arr)
+    assert decoded.flags["F_CONTIGUOUS"]
+
+
+def test_array_list_roundtrip():
+    arrays = [np.full((2, 2), i, dtype=np.float32) for i in range(4)]
+    decoded = _roundtrip(arrays)
+    assert len(decoded) == len(arrays)
+    for got, want in zip(decoded, arrays):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_decoders_are_freed():
+    decoder = btoon_enhanced.EnhancedDecoder()
+    np.testing.assert_array_equal(decoder.decode(btoon_enhanced.dumps(np.arange(3))), np.arange(3))
+    ref = weakref.ref(decoder)
+    del decoder
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,130 @@
+"""
+StreamEncoder/StreamDecoder round-trip tests
+"""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import btoon
+import pytest
+
+RECORDS = [{"id": i, "value": i * 1.5, "tags": ["a", "b"]} for i in range(200)]
+
+
+def _write(records, **kwargs):
+    buf = io.BytesIO()
+    with btoon.StreamEncoder(buf, **kwargs) as encoder:
+        for record in records:
+            encoder.write(record)
+    buf.seek(0)
+    return buf
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"compress": True},
+    {"block_size": 256},
+    {"block_size": 1 << 20, "compress": True},
+])
+def test_stream_roundtrip(options):
+    assert list(btoon.StreamDecoder(_write(RECORDS, **options))) == RECORDS
+
+
+@pytest.mark.parametrize("options", [{}, {"block_size": 256}])
+def test_stream_bulk_readers(options):
+    assert list(btoon.StreamDecoder(_write(RECORDS, **options)).iter_frames_fast()) == RECORDS
+    assert list(btoon.StreamDecoder(_write(RECORDS, **options)).iter_parallel(4)) == RECORDS
+
+
+@pytest.mark.parametrize("options", [{}, {"block_size": 256}])
+def test_records_shaped_like_a_block_are_not_expanded(options):
+    records = [{"__stream_block__": b"\x00\x00\x00\x01\xc0"}, {"__stream_block__": 1}]
+    assert list(btoon.StreamDecoder(_write(records, **options))) == records
+
+
+def test_write_is_eager_by_default():
+    buf = io.BytesIO()
+    encoder = btoon.StreamEncoder(buf)
+    record = {"id": 0}
+    for i in range(3):
+        record["id"] = i
+        encoder.write(record)
+    # Everything is in fp without flush(), and reusing the dict is safe
+    buf.seek(0)
+    assert list(btoon.StreamDecoder(buf)) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_batched_writes_wait_for_flush():
+    buf = io.BytesIO()
+    encoder = btoon.StreamEncoder(buf, batch_size=4)
+    encoder.write_many(RECORDS[:6])
+    assert len(list(btoon.StreamDecoder(io.BytesIO(buf.getvalue())))) == 4
+    encoder.flush()
+    assert list(btoon.StreamDecoder(io.BytesIO(buf.getvalue()))) == RECORDS[:6]
+
+
+def test_write_many_batch_writes_partial_batch_when_eager():
+    buf = io.BytesIO()
+    btoon.StreamEncoder(buf).write_many(RECORDS[:10], batch=4)
+    buf.seek(0)
+    assert list(btoon.StreamDecoder(buf)) == RECORDS[:10]
+
+
+class _Trickle(io.RawIOBase):
+    """Raw stream returning at most three bytes per read, like a slow pipe."""
+    
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, b):
+        chunk = self._data.read(min(len(b), 3))
+        b[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class _ReadOnly:
+    """File-like object with read() but no readinto()."""
+    
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+    
+    def read(self, n=-1):
+        return self._data.read(n)
+
+
+@pytest.mark.parametrize("wrap", [_Trickle, _ReadOnly])
+def test_decoder_handles_partial_reads_and_read_only_streams(wrap):
+    data = _write(RECORDS[:20]).getvalue()
+    assert list(btoon.StreamDecoder(wrap(data))) == RECORDS[:20]
+
+
+def test_decoder_reports_truncated_stream():
+    data = _write(RECORDS[:2]).getvalue()
+    decoder = btoon.StreamDecoder(_Trickle(data[:-1]))
+    assert next(decoder) == RECORDS[0]
+    with pytest.raises(btoon.BtoonException):
+        next(decoder)
+
+
+def test_read_all_frames(tmp_path):
+    path = tmp_path / "frames.btoon"
+    path.write_bytes(btoon._native.Encoder().encode_framed(RECORDS))
+    assert btoon._native.read_all_frames(str(path)) == RECORDS
+    
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(btoon.BtoonException):
+        btoon._native.read_all_frames(str(path))
+    
+    path.write_bytes(b"")
+    assert btoon._native.read_all_frames(str(path)) == []
+
+
+def test_read_all_frames_from_threads(tmp_path):
+    path = tmp_path / "frames.btoon"
+    path.write_bytes(btoon._native.Encoder().encode_framed(RECORDS))
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(btoon._native.read_all_frames, [str(path)] * 8))
+    assert results == [RECORDS] * 8
@@ -0,0 +1,61 @@
+"""
+Datetime round-trip tests, run under a non-UTC local timezone so naive
+values that are read back as local time would show up shifted
+"""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import btoon
+import btoon_enhanced
+import pytest
+
+DATETIMES = [
+    datetime(2024, 1, 1, 12),
+    datetime(2024, 7, 1, 23, 59, 59, 999999),
+    datetime(1969, 12, 31, 23, 59, 59, 500000),
+    datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+    datetime(2024, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+    datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=-8))),
+]
+
+
+@pytest.fixture(autouse=True)
+def non_utc_local_time(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset() not available")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.parametrize("dt", DATETIMES)
+def test_native_roundtrip(dt):
+    decoded = btoon.loads(btoon.dumps({"at": dt}))["at"]
+    assert decoded == dt
+    assert decoded.utcoffset() == dt.utcoffset()
+
+
+@pytest.mark.parametrize("dt", DATETIMES)
+def test_enhanced_roundtrip(dt):
+    decoded = btoon_enhanced.loads(btoon_enhanced.dumps({"at": dt}))["at"]
+    assert decoded == dt
+    assert decoded.utcoffset() == dt.utcoffset()
+
+
+@pytest.mark.parametrize("dt", DATETIMES)
+def test_enhanced_and_native_agree(dt):
+    assert btoon.loads(btoon_enhanced.dumps(dt)) == btoon_enhanced.loads(btoon.dumps(dt)) == dt
+
+
+@pytest.mark.parametrize("dt", DATETIMES)
+def test_timestamp_roundtrip(dt):
+    ts = btoon_enhanced.Timestamp.from_datetime(dt)
+    decoded = btoon_enhanced.Timestamp.from_bytes(ts.to_bytes()).to_datetime()
+    # Naive values are taken as UTC and come back timezone-aware
+    assert decoded.tzinfo is not None
+    assert decoded == (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc))
+    assert btoon_enhanced.Timestamp(ts.seconds, ts.nanoseconds).to_datetime().tzinfo == timezone.utc
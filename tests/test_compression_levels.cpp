@@ -4,6 +4,7 @@
 #include <random>
 #include <chrono>
 #include <iomanip>
+#include <limits>
 
 using namespace btoon;
 using namespace std::chrono;
@@ -263,3 +264,108 @@ TEST_F(CompressionLevelsTest, ZSTDLevels) {
     }
 }
 #endif
+
+#ifdef BTOON_WITH_ZSTD
+TEST_F(CompressionLevelsTest, ZSTDWorkers) {
+    Value test_value = Binary(highly_compressible);
+    
+    EncodeOptions opts;
+    opts.compress = true;
+    opts.compression_algorithm = CompressionAlgorithm::ZSTD;
+    opts.compression_workers = 2;
+    
+    auto encoded = encode(test_value, opts);
+    EXPECT_LT(encoded.size(), highly_compressible.size());
+    EXPECT_EQ(decode(encoded), test_value);
+}
+#endif
+
+#ifdef BTOON_WITH_ZSTD
+TEST_F(CompressionLevelsTest, ZSTDIndependentFrames) {
+    std::vector<uint8_t> test_data = highly_compressible;
+    
+    auto single = compress_zstd(test_data, 3);
+    auto framed = compress_zstd(test_data, 3, 0, 1024);
+    EXPECT_GT(framed.size(), single.size());  // One frame header per chunk
+    EXPECT_EQ(decompress_zstd(framed), test_data);
+    
+    EncodeOptions opts;
+    opts.compress = true;
+    opts.compression_algorithm = CompressionAlgorithm::ZSTD;
+    opts.compression_frame_size = 2048;
+    
+    Value test_value = Binary(highly_compressible);
+    EXPECT_EQ(decode(encode(test_value, opts)), test_value);
+}
+#endif
+
+#ifdef BTOON_WITH_ZSTD
+namespace {
+// Single-segment ZSTD frame holding one raw block, with an arbitrary
+// declared content size
+std::vector<uint8_t> raw_zstd_frame(uint64_t content_size, const std::vector<uint8_t>& block) {
+    std::vector<uint8_t> frame = {0x28, 0xB5, 0x2F, 0xFD, 0xE0};
+    for (int i = 0; i < 8; ++i) {
+        frame.push_back(static_cast<uint8_t>(content_size >> (8 * i)));
+    }
+    uint32_t block_header = (static_cast<uint32_t>(block.size()) << 3) | 1;
+    for (int i = 0; i < 3; ++i) {
+        frame.push_back(static_cast<uint8_t>(block_header >> (8 * i)));
+    }
+    frame.insert(frame.end(), block.begin(), block.end());
+    return frame;
+}
+} // namespace
+
+TEST_F(CompressionLevelsTest, ZSTDRejectsBadFrameSizes) {
+    std::vector<uint8_t> block(100, 0xAB);
+    EXPECT_EQ(decompress_zstd(raw_zstd_frame(block.size(), block)), block);
+    
+    // Declared sizes that wrap around when added up
+    auto wrapped = raw_zstd_frame(std::numeric_limits<uint64_t>::max() - 49, block);
+    auto second = raw_zstd_frame(block.size(), block);
+    wrapped.insert(wrapped.end(), second.begin(), second.end());
+    EXPECT_THROW(decompress_zstd(wrapped), BtoonException);
+    
+    // Sizes that disagree with the expected total
+    auto framed = compress_zstd(highly_compressible, 3, 0, 1024);
+    EXPECT_EQ(decompress_zstd(framed, {}, highly_compressible.size()), highly_compressible);
+    EXPECT_THROW(decompress_zstd(framed, {}, highly_compressible.size() - 1), BtoonException);
+}
+#endif
+
+#ifdef BTOON_WITH_ZSTD
+TEST_F(CompressionLevelsTest, ZSTDDictionary) {
+    std::vector<std::vector<uint8_t>> samples;
+    for (int i = 0; i < 1000; ++i) {
+        Value msg = Map{
+            {"event", String("page_view")},
+            {"user_id", Int(i)},
+            {"path", String("/products/" + std::to_string(i % 37))},
+            {"referrer", String("https://example.com/search?q=item" + std::to_string(i % 11))}
+        };
+        samples.push_back(encode(msg));
+    }
+    
+    auto dict = train_zstd_dictionary(samples, 4096);
+    ASSERT_FALSE(dict.empty());
+    EXPECT_LE(dict.size(), 4096u);
+    
+    const auto& sample = samples.back();
+    auto plain = compress_zstd(sample, 3);
+    auto with_dict = compress_zstd(sample, 3, 0, 0, dict);
+    EXPECT_LT(with_dict.size(), plain.size());
+    EXPECT_EQ(decompress_zstd(with_dict, dict), sample);
+    
+    EncodeOptions opts;
+    opts.compress = true;
+    opts.compression_algorithm = CompressionAlgorithm::ZSTD;
+    opts.min_compression_size = 0;
+    opts.compression_dictionary = dict;
+    DecodeOptions dopts;
+    dopts.compression_dictionary = dict;
+    
+    Value test_value = decode(sample);
+    EXPECT_EQ(decode(encode(test_value, opts), dopts), test_value);
+}
+#endif
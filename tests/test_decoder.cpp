@@ -77,6 +77,18 @@ TEST(DecoderTest, DecodeMap) {
     EXPECT_EQ(std::get<Uint>((*map)["age"]), 30);
 }
 
+TEST(DecoderTest, DecodeExtension) {
+    std::vector<uint8_t> data = {0xd6, 0x07, 0x01, 0x02, 0x03, 0x04}; // fixext4, type 7
+    Value decoded = decode(data);
+    auto* ext = std::get_if<Extension>(&decoded);
+    ASSERT_NE(ext, nullptr);
+    EXPECT_EQ(ext->type, 7);
+    EXPECT_EQ(ext->data, (std::vector<uint8_t>{0x01, 0x02, 0x03, 0x04}));
+    
+    Value original = Extension{-7, {0x00, 0xff, 0xff, 0xff, 0xfe, 0x30, 0x39}};
+    EXPECT_EQ(decode(encode(original)), original);
+}
+
 TEST(DecoderTest, InvalidBuffer) {
     std::vector<uint8_t> empty;
     EXPECT_THROW(decode(empty), BtoonException);